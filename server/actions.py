@@ -28,7 +28,7 @@ SECURITY:
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 # ANCHOR: server.actions.router
 # Create API router with /api prefix
@@ -81,13 +81,18 @@ class TodoListResponse(BaseModel):
 # ROLE: data storage layer
 # NOTE: Replace with real database (PostgreSQL, MongoDB) in production
 
-# In-memory data store (for demo; use DB in production)
-_todos_db: List[Dict[str, Any]] = [
+# Seed data, built once at import; the store holds copies so mutations
+# never reach it
+_INITIAL_TODOS: Tuple[Dict[str, Any], ...] = (
     {"id": 1, "text": "Learn Pickle-Reactor", "done": False},
     {"id": 2, "text": "Build VDOM diffing", "done": True},
     {"id": 3, "text": "Implement server actions", "done": False},
-]
-_next_id = 4
+)
+
+# In-memory data store (for demo; use DB in production)
+# NOTE: Always mutated in place, never rebound, so importers stay current
+_todos_db: List[Dict[str, Any]] = [dict(t) for t in _INITIAL_TODOS]
+_next_id = len(_INITIAL_TODOS) + 1
 
 
 def _reset_database():
@@ -97,13 +102,9 @@ def _reset_database():
 
     SEE: tests.integration.conftest
     """
-    global _todos_db, _next_id
-    _todos_db = [
-        {"id": 1, "text": "Learn Pickle-Reactor", "done": False},
-        {"id": 2, "text": "Build VDOM diffing", "done": True},
-        {"id": 3, "text": "Implement server actions", "done": False},
-    ]
-    _next_id = 4
+    global _next_id
+    _todos_db[:] = [dict(t) for t in _INITIAL_TODOS]
+    _next_id = len(_INITIAL_TODOS) + 1
 
 
 # ANCHOR: server.actions.endpoints
@@ -203,9 +204,8 @@ async def delete_todo(todo_id: int):
 
     SEE: client.actions.delete_todo, tests.integration.test-delete-todo
     """
-    global _todos_db
     original_len = len(_todos_db)
-    _todos_db = [t for t in _todos_db if t["id"] != todo_id]
+    _todos_db[:] = [t for t in _todos_db if t["id"] != todo_id]
 
     if len(_todos_db) == original_len:
         raise HTTPException(status_code=404, detail="Todo not found")
@@ -21,19 +21,25 @@ Phase 4: Routing & Multiple Pages
 SECURITY:
 - CSP headers configured for WASM execution
 - HTML escaping via render_to_string
+
+PERFORMANCE:
+- /dashboard HTML is cached per stats tuple and served with an ETag;
+  conditional requests get 304 Not Modified
 """
 
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from server.ssr import render_to_string
-from server.actions import router as actions_router, _todos_db  # Phase 5: Server actions
+from server import actions as server_actions  # Phase 5: Todo store for dashboard data
+from server.actions import router as actions_router  # Phase 5: Server actions
 from pages.index import IndexPage
 from pages.about import AboutPage
 from pages.todos import TodosPage
 from pages.dashboard import DashboardPage  # Phase 5: Dashboard with data loading
 from shared.state import ComponentInstance, render_component
 import json  # Phase 5: For embedding initial props
+import hashlib
 
 
 # ANCHOR: server.app.instance
@@ -71,10 +77,22 @@ ROUTES = {
 }
 
 
+# ANCHOR: server.app.dashboard-cache
+# TITLE: Cached /dashboard HTML keyed on todo stats
+# ROLE: caching layer
+# SEE: server.app.route_handler
+
+# The dashboard is a pure function of (total, done, active), so the rendered
+# page only changes when a todo write changes those counts.
+_CACHED_STATS_KEY: tuple[int, int, int] | None = None
+_CACHED_HTML: bytes | None = None
+_CACHED_ETAG: str = ""
+
+
 # ANCHOR: server.app.health
 # TITLE: Health check endpoint
 # ROLE: server/http layer
-# SEE: tests.integration.test-server-routing
+# SEE: tests.integration.test-server
 
 @app.get("/health")
 async def health():
@@ -83,7 +101,7 @@ async def health():
     Returns:
         JSON with status OK and current phase
 
-    SEE: tests.integration.test-server-routing.TestHealthEndpoint
+    SEE: tests.integration.test-server.TestHealthEndpoint
     """
     return {"status": "ok", "framework": "pickle-reactor", "phase": "4"}
 
@@ -94,7 +112,7 @@ async def health():
 # SEE: server.app.routes, server.ssr.render-to-string, tests.integration.test-routing
 
 @app.get("/{path:path}", response_class=HTMLResponse)
-async def route_handler(path: str = ""):
+async def route_handler(request: Request, path: str = ""):
     """Render page with SSR based on URL path.
 
     Phase 4: Dynamic routing
@@ -107,7 +125,12 @@ async def route_handler(path: str = ""):
     SEO benefits, and proper routing. Pyodide will hydrate the page
     client-side with the correct component.
 
+    Phase 5: /dashboard is served from a cache keyed on todo stats
+    - ETag set on every dashboard response
+    - If-None-Match matching the current ETag returns 304
+
     Args:
+        request: Incoming request (for If-None-Match)
         path: URL path (e.g., "", "about", "todos")
 
     Returns:
@@ -134,17 +157,24 @@ async def route_handler(path: str = ""):
 
     # Phase 5: Load initial data for pages that need it
     initial_props = {}
+    stats_key = None
     if route_path == '/dashboard':
         # Fetch todos and compute stats for dashboard
-        todos = _todos_db  # From server.actions
+        todos = server_actions._todos_db
+        done = sum(1 for t in todos if t['done'])
+        stats_key = (len(todos), done, len(todos) - done)
         initial_props = {
             'data': {
-                'total': len(todos),
-                'done': sum(1 for t in todos if t['done']),
-                'active': sum(1 for t in todos if not t['done']),
+                'total': stats_key[0],
+                'done': stats_key[1],
+                'active': stats_key[2],
             }
         }
 
+        # Serve cached HTML while stats are unchanged
+        if stats_key == _CACHED_STATS_KEY:
+            return _cached_dashboard_response(request)
+
     # Create component instance for SSR
     # On server, state is initialized but never updated (single-shot render)
     inst = ComponentInstance()
@@ -589,4 +619,65 @@ async def route_handler(path: str = ""):
 </body>
 </html>"""
 
+    if stats_key is not None:
+        _store_dashboard_cache(stats_key, shell)
+        return _cached_dashboard_response(request)
+
     return shell
+
+
+def _store_dashboard_cache(stats_key: tuple[int, int, int], shell: str) -> None:
+    """Store rendered dashboard HTML and its ETag.
+
+    Args:
+        stats_key: (total, done, active) the HTML was rendered from
+        shell: Complete HTML document
+
+    SEE: server.app.dashboard-cache
+    """
+    global _CACHED_STATS_KEY, _CACHED_HTML, _CACHED_ETAG
+
+    body = shell.encode("utf-8")
+    _CACHED_HTML = body
+    _CACHED_ETAG = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+    _CACHED_STATS_KEY = stats_key
+
+
+def _cached_dashboard_response(request: Request) -> Response:
+    """Build response for the cached dashboard HTML.
+
+    Returns 304 Not Modified when If-None-Match matches the cached ETag,
+    otherwise the cached bytes with the ETag header.
+
+    SEE: server.app.dashboard-cache
+    """
+    headers = {"ETag": _CACHED_ETAG}
+    if _etag_matches(request.headers.get("if-none-match"), _CACHED_ETAG):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=_CACHED_HTML, headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against etag.
+
+    WHY: Browsers and proxies send comma-separated lists, weak W/ tags
+    and "*"; If-None-Match uses weak comparison (RFC 9110 section 13.1.2)
+
+    Args:
+        if_none_match: Raw header value, or None when absent
+        etag: Current strong ETag, quoted
+
+    Returns:
+        True when any listed tag matches etag or the header is "*"
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
@@ -1,29 +1,75 @@
 # ANCHOR: server.ssr
 # TITLE: Server-side rendering (SSR) implementation
 # ROLE: server/rendering layer
-# EXPORTS: render_to_string
+# EXPORTS: render_to_string, render_to_bytes, render_to_stream
 # SEE: shared.vdom.VNode, server.app.home, tests.unit.test-ssr
 
 """
 Server-Side Rendering (SSR) module for pickle-reactor framework.
 
 This module provides render_to_string() function to convert VNode trees
-into HTML strings for initial page load. Critical security feature: all
-user-provided text content is HTML-escaped to prevent XSS attacks.
+into HTML strings for initial page load, render_to_bytes() for UTF-8
+response bodies, and render_to_stream() to emit the same HTML fragment by
+fragment. Critical security feature: all user-provided text content is
+HTML-escaped to prevent XSS attacks.
 
 SECURITY:
-- ALWAYS escapes text content with html.escape()
+- ALWAYS escapes text content (via html.escape(quote=True))
 - Event handlers (on_*) are ignored on server (client-only)
 - Attribute values are properly quoted and escaped
 
 SEE: RESEARCH.md section 4 - Python SSR Frameworks
 """
 
-from html import escape as esc
-from typing import Union
+import html
+from functools import lru_cache
+from typing import Any, Callable, Final, Mapping, Optional, Union
 from shared.vdom import VNode
 
 
+# HTML void elements: no closing tag and no children
+_VOID_TAGS: Final[frozenset[str]] = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "source", "track", "wbr",
+})
+
+
+# Per-tag markup strings ("<tag", "<tag>", "</tag>" or None for void tags)
+_TAG_STRINGS: dict[str, tuple[str, str, Optional[str]]] = {}
+
+
+# ANCHOR: server.ssr.escape
+# TITLE: HTML escaping via html.escape with a short-string cache
+# ROLE: security/escaping layer
+
+# Strings at least this long bypass the escape cache (user content)
+_ESCAPE_CACHE_MAX_LEN: Final = 128
+
+# WHY: Class names, labels and list-item text repeat across a page and
+# across requests; short strings are memoized, long ones are not cached
+# so large user content cannot crowd the cache
+_escape_cached: Callable[[str], str] = lru_cache(maxsize=4096)(html.escape)
+
+
+def _escape(s: str) -> str:
+    """Escape text or an attribute value for HTML output.
+
+    WHY: html.escape chains C-level str.replace passes, which stay fast on
+    long text and return s itself when nothing matches; a regex pre-scan
+    or hand-rolled replace chain measured no faster
+
+    Args:
+        s: Raw string
+
+    Returns:
+        String with &, <, >, " and ' replaced by entities (s itself when
+        it contains none of them)
+    """
+    if len(s) < _ESCAPE_CACHE_MAX_LEN:
+        return _escape_cached(s)
+    return html.escape(s)
+
+
 def render_to_string(node: Union[VNode, str]) -> str:
     """Render VNode to HTML string with proper escaping.
 
@@ -37,14 +83,19 @@ def render_to_string(node: Union[VNode, str]) -> str:
     Returns:
         HTML string representation
 
+    Raises:
+        ValueError: If a void element has children
+
     INVARIANTS:
     - Always escapes user text content to prevent XSS
     - Event handlers (on_*) are ignored on server
     - Boolean props: True → attribute present, False/None → omitted
     - Attribute values are always quoted
+    - Void elements (input, img, br, ...) render without a closing tag;
+      giving one children raises ValueError
 
     Security:
-        - Text content is escaped with html.escape()
+        - Text content is escaped (see _escape)
         - Attribute values are escaped
         - Never trust user input - always escape
 
@@ -57,39 +108,198 @@ def render_to_string(node: Union[VNode, str]) -> str:
 
     SEE: shared.vdom.VNode, server.app.home, tests.unit.test-ssr
     """
-    # Handle text nodes (strings)
-    if isinstance(node, str):
-        return esc(node)
+    out: list[str] = []
+    _render(node, out.append)
+    return "".join(out)
+
+
+def render_to_bytes(node: Union[VNode, str]) -> bytes:
+    """Render VNode to UTF-8 encoded HTML for a response body.
 
-    # Handle VNode
-    tag = node.tag
-    props = node.props or {}
-    children = node.children or []
+    WHY: Joining the fragments and encoding the result once is faster than
+    encoding each fragment into a bytearray (per-fragment encode calls
+    dominate); callers that need bytes skip their own str round trip
 
-    # Build attributes from props
+    Args:
+        node: VNode to render or plain text string
+
+    Returns:
+        UTF-8 bytes of render_to_string(node)
+
+    SEE: render_to_string
+    """
+    out: list[str] = []
+    _render(node, out.append)
+    return "".join(out).encode("utf-8")
+
+
+def render_to_stream(node: Union[VNode, str], write: Callable[[str], None]) -> None:
+    """Render VNode to HTML, passing each fragment to write as it is produced.
+
+    WHY: Lets callers forward fragments to a response body or file without
+    holding the whole page as one string. Escaping and output are identical
+    to render_to_string
+
+    Args:
+        node: VNode to render or plain text string
+        write: Callable taking one str fragment (e.g. StringIO().write)
+
+    SEE: render_to_string
+    """
+    _render(node, write)
+
+
+def _render(node: Union[VNode, str], write: Callable[[str], None]) -> None:
+    """Emit the HTML fragments for node through write.
+
+    WHY: Walks the tree with an explicit stack instead of recursing, so
+    deep trees pay no per-node frame setup and cannot hit the recursion
+    limit. Each entry is (node, closing); after a VNode's open tag is
+    written its close tag string is pushed with closing=True, below its
+    children
+
+    Args:
+        node: VNode to render or plain text string
+        write: Sink called with each HTML fragment in order
+
+    SEE: render_to_string
+    """
+    stack: list[tuple[Union[VNode, str], bool]] = [(node, False)]
+    while stack:
+        node, closing = stack.pop()
+
+        # Close tags are pushed as ready-made strings
+        if closing:
+            write(node)
+            continue
+
+        # Handle text nodes (strings)
+        if isinstance(node, str):
+            write(_escape(node))
+            continue
+
+        tag = node.tag
+        strings = _TAG_STRINGS.get(tag) or _tag_strings(tag)
+
+        # Open tag with attributes from props
+        props = node.props
+        if props:
+            write(strings[0])
+            _render_props(props, write)
+            write(">")
+        else:
+            write(strings[1])
+
+        # Void elements end at the open tag and cannot hold content
+        close = strings[2]
+        if close is None:
+            if node.children:
+                raise ValueError(f"void element <{tag}> cannot have children")
+            continue
+
+        # Close after the children; push them reversed so they pop in order
+        stack.append((close, True))
+        children = node.children
+        if children:
+            stack.extend([(c, False) for c in reversed(children)])
+
+
+def _tag_strings(tag: str) -> tuple[str, str, Optional[str]]:
+    """Build and cache the markup strings for tag.
+
+    Args:
+        tag: HTML tag name
+
+    Returns:
+        ("<tag", "<tag>", "</tag>"); the close string is None for void
+        elements
+
+    SEE: _TAG_STRINGS
+    """
+    close = None if tag in _VOID_TAGS else f"</{tag}>"
+    strings = _TAG_STRINGS[tag] = (f"<{tag}", f"<{tag}>", close)
+    return strings
+
+
+# Precompute the tags the pages and helpers use; others are added on first use
+for _tag in ("div", "span", "p", "a", "button", "h1", "h2", "h3",
+             "ul", "li", "form", "label", "input", "img", "br"):
+    _tag_strings(_tag)
+del _tag
+
+
+def _render_props(props: Mapping[str, Any], write: Callable[[str], None]) -> None:
+    """Emit the attribute fragments for props through write.
+
+    Args:
+        props: VNode props
+        write: Sink called with each HTML fragment in order
+
+    SEE: _render
+    """
     # SECURITY: Event handlers (on_*) are ignored on server
-    attr_parts = []
     for k, v in props.items():
-        # Skip event handlers (client-side only)
-        if k.startswith("on_"):
+        # Omit false/none attributes
+        if v is False or v is None:
+            continue
+        # Skip event handlers (client-side only); slice compare is cheaper
+        # than startswith for a short literal
+        if k[:3] == "on_":
             continue
 
-        # Handle boolean attributes
         if v is True:
-            attr_parts.append(k)
-        elif v is False or v is None:
-            # Omit false/none attributes
+            write(f" {k}")
             continue
+        # Inline style dicts become one CSS declaration string
+        if k == "style" and type(v) is dict:
+            v = _style_to_css(v)
+
+        # Reuse the prebuilt ' key="' prefix; only the value is formatted
+        write(_attr_prefix(k))
+
+        # Dispatch on the value type once; numbers need no escaping
+        t = type(v)
+        if t is str:
+            # SECURITY: Escape attribute values
+            write(_escape(v))
+        elif t is int or t is float:
+            write(str(v))
         else:
-            # Regular attribute with value
             # SECURITY: Escape attribute values
-            attr_parts.append(f'{k}="{esc(str(v))}"')
+            write(_escape(str(v)))
+        write('"')
 
-    # Build attribute string
-    attrs = (" " + " ".join(attr_parts)) if attr_parts else ""
 
-    # Recursively render children
-    inner = "".join(render_to_string(c) for c in children)
+# WHY: Bounded because props dicts can carry arbitrary keys (e.g. data-*
+# attributes built from content)
+@lru_cache(maxsize=256)
+def _attr_prefix(name: str) -> str:
+    """Return the ' name="' fragment that opens an attribute value."""
+    return f' {name}="'
+
+
+def _style_to_css(style: dict[str, Any]) -> str:
+    """Serialize an inline style dict to CSS text.
+
+    WHY: The client applies style dicts key by key through element.style;
+    the server has to emit the equivalent style attribute, built with one
+    join rather than repeated concatenation
+
+    Args:
+        style: Style property names (camelCase or kebab-case) to values
+
+    Returns:
+        Declarations joined with ';' (e.g. "font-size:12px;color:red");
+        escaped by the caller like any attribute value
+
+    SEE: client.runtime.mount, _css_property
+    """
+    return ";".join([f"{_css_property(k)}:{v}" for k, v in style.items()])
+
 
-    # Return complete HTML element
-    return f"<{tag}{attrs}>{inner}</{tag}>"
+@lru_cache(maxsize=256)
+def _css_property(name: str) -> str:
+    """Map a style key such as backgroundColor to background-color."""
+    if "-" in name or name.islower():
+        return name
+    return "".join(f"-{c.lower()}" if c.isupper() else c for c in name)
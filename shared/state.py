@@ -1,7 +1,7 @@
 # ANCHOR: shared.state
 # TITLE: State management implementation (ComponentInstance, use_state, render_component)
 # ROLE: state/hooks layer
-# EXPORTS: ComponentInstance, use_state, render_component
+# EXPORTS: ComponentInstance, use_state, render_component, batch, memo
 # SEE: client.runtime.hydrate, tests.unit.test-state, RESEARCH.md section 5
 
 """
@@ -11,6 +11,8 @@ This module provides React-style hooks for component state management:
 - ComponentInstance: Tracks state array and hook index for a component
 - use_state(initial): Hook for managing component state
 - render_component(fn, props, instance): Renders component with hook context
+- batch(): Context manager that coalesces state updates into one re-render
+- memo(component): Opt-in cache of a pure component's output by props and state
 
 INVARIANTS:
 - use_state must be called during component render
@@ -21,6 +23,8 @@ INVARIANTS:
 SEE: RESEARCH.md section 5 - State Management Patterns for Python
 """
 
+from contextlib import contextmanager
+from functools import wraps
 from typing import Any, Callable, Tuple, Optional
 
 
@@ -29,6 +33,15 @@ from typing import Any, Callable, Tuple, Optional
 # Set by render_component, used by hooks like use_state
 _current_instance: Optional['ComponentInstance'] = None
 
+# ANCHOR: shared.state.batching
+# Batch depth and instances with updates deferred by batch()
+# Set by batch, consumed by set_value
+_batch_depth: int = 0
+_pending_updates: list['ComponentInstance'] = []
+
+# Entries kept per memo()-wrapped component before the oldest is evicted
+_MEMO_MAXSIZE: int = 512
+
 
 class ComponentInstance:
     """Component instance with hook state tracking.
@@ -46,6 +59,9 @@ class ComponentInstance:
     SEE: shared.state.use_state, client.runtime.hydrate
     """
 
+    # WHY: No per-instance __dict__; one live instance per mounted component
+    __slots__ = ("state", "hook_index", "schedule_update")
+
     def __init__(self):
         """Initialize component instance with empty state."""
         self.state: list[Any] = []
@@ -86,12 +102,14 @@ def use_state(initial: Any | Callable[[], Any]) -> Tuple[Any, Callable[[Any], No
     if inst is None:
         raise RuntimeError("use_state called outside component render")
 
+    # Bind the state list once; set_value closes over it too
+    state = inst.state
     idx = inst.hook_index
+    inst.hook_index = idx + 1
 
     # Initialize state on first call at this index
-    if idx >= len(inst.state):
-        value = initial() if callable(initial) else initial
-        inst.state.append(value)
+    if idx >= len(state):
+        state.append(initial() if callable(initial) else initial)
 
     def set_value(new: Any) -> None:
         """Update state and trigger re-render.
@@ -103,13 +121,15 @@ def use_state(initial: Any | Callable[[], Any]) -> Tuple[Any, Callable[[Any], No
 
         SEE: client.runtime.rerender
         """
-        inst.state[idx] = new
-        if inst.schedule_update:
+        state[idx] = new
+        if _batch_depth:
+            # Defer re-render until the outermost batch() exits
+            if inst not in _pending_updates:
+                _pending_updates.append(inst)
+        elif inst.schedule_update:
             inst.schedule_update()
 
-    value = inst.state[idx]
-    inst.hook_index += 1
-    return value, set_value
+    return state[idx], set_value
 
 
 def render_component(component_fn: Callable[[dict], Any], props: dict, instance: ComponentInstance) -> Any:
@@ -131,7 +151,8 @@ def render_component(component_fn: Callable[[dict], Any], props: dict, instance:
         - instance is initialized ComponentInstance
 
     Postconditions:
-        - _current_instance is cleared (None)
+        - _current_instance is restored to its value before the call
+          (None at top level), also when component_fn raises
         - instance.hook_index is reset for next render
         - Returns VNode from component_fn
 
@@ -143,14 +164,131 @@ def render_component(component_fn: Callable[[dict], Any], props: dict, instance:
     """
     global _current_instance
 
-    # Set context for hooks
+    # Set context for hooks, remembering the enclosing render (if any)
+    outer = _current_instance
     _current_instance = instance
     instance.hook_index = 0
 
-    # Call component function
-    vnode = component_fn(props)
+    try:
+        return component_fn(props)
+    finally:
+        # Restore context even if the component raises
+        _current_instance = outer
+
+
+@contextmanager
+def batch():
+    """Coalesce state updates into a single re-render.
+
+    set_value calls made inside the block update state immediately but
+    defer schedule_update until the outermost batch() exits, so each
+    affected instance re-renders once instead of once per setter.
+
+    WHY: Handlers that call several setters in a row (e.g. stats, loading,
+    error) would otherwise re-render the component once per call
+
+    Postconditions:
+        - schedule_update called at most once per updated instance
+        - Pending updates flushed even if the block raises
+
+    Examples:
+        >>> with batch():
+        ...     set_stats(new_stats)
+        ...     set_loading(False)
+
+    SEE: shared.state.use_state, pages.dashboard.DashboardPage
+    """
+    global _batch_depth
+
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if not _batch_depth:
+            pending = _pending_updates[:]
+            _pending_updates.clear()
+            for inst in pending:
+                if inst.schedule_update:
+                    inst.schedule_update()
+
+
+def memo(component: Callable[[dict], Any]) -> Callable[[dict], Any]:
+    """Cache a pure component's output by its props and hook state.
+
+    The wrapped component returns the previously rendered VNode when called
+    again with equal props while its own use_state slots hold equal values.
+    Calls with unhashable props or state values always render.
 
-    # Clear context
-    _current_instance = None
+    WHY: Pure subtrees re-rendered on unrelated state changes would
+    otherwise be rebuilt node by node
 
-    return vnode
+    Args:
+        component: Component function whose output depends only on props
+            and its own use_state values
+
+    Returns:
+        Wrapped component with the same signature
+
+    Postconditions:
+        - At most _MEMO_MAXSIZE cached outputs; oldest evicted first
+        - A cache hit skips the component body but advances hook_index
+          past its hooks, so later use_state calls keep their slots
+        - A hit returns the same VNode object; when it lands at a new
+          position, patch() mounts a copy of it
+
+    Examples:
+        >>> @memo
+        ... def Badge(props):
+        ...     return span({"class": "badge"}, props["label"])
+
+    SEE: shared.state.render_component, shared.state.use_state
+    """
+    cache: dict[tuple, Any] = {}
+    # use_state calls per render; fixed by the rules of hooks, learned on
+    # the first render
+    hook_count: Optional[int] = None
+
+    @wraps(component)
+    def wrapped(props: dict) -> Any:
+        nonlocal hook_count
+        inst = _current_instance
+        start = inst.hook_index if inst else 0
+
+        try:
+            items = frozenset(props.items())
+        except TypeError:
+            # Unhashable props: render without caching
+            return component(props)
+
+        # Key only on this component's own hook slots, so sibling and
+        # parent state changes do not affect it
+        if hook_count is not None:
+            own = tuple(inst.state[start:start + hook_count]) if inst else ()
+            if len(own) == hook_count:
+                try:
+                    vnode = cache[items, own]
+                except KeyError:
+                    pass
+                except TypeError:
+                    return component(props)
+                else:
+                    # Skip the hooks the body would have called
+                    if inst:
+                        inst.hook_index = start + hook_count
+                    return vnode
+
+        vnode = component(props)
+        hook_count = inst.hook_index - start if inst else 0
+        # Same slots the lookup reads; a first render has just filled them
+        key = (items, tuple(inst.state[start:start + hook_count]) if inst else ())
+        try:
+            hash(key)
+        except TypeError:
+            return vnode
+        if len(cache) >= _MEMO_MAXSIZE:
+            del cache[next(iter(cache))]
+        cache[key] = vnode
+        return vnode
+
+    return wrapped
@@ -1,29 +1,36 @@
 # ANCHOR: shared.vdom
 # TITLE: Virtual DOM implementation with VNode and HTML helpers
 # ROLE: vdom/representation layer
-# EXPORTS: VNode, h, div, button, span, h1, p, input_field, and other HTML helpers
+# EXPORTS: VNode, h, subtree_equal, props_equal, memo_node, memo_node_by, div, button, span, h1, p, input_field, and other HTML helpers
 # SEE: server.ssr.render-to-string, client.runtime.mount, tests.unit.test-vdom
 
 """
 Virtual DOM (VDOM) implementation for pickle-reactor framework.
 
 This module provides:
-- VNode dataclass: Virtual node representation with tag, props, children, and key
+- VNode class: Virtual node representation with tag, props, children, and key
 - h() function: Helper for creating VNodes
+- memo_node()/memo_node_by(): Caches for VNode factories with stable arguments
 - HTML element helpers: div(), button(), span(), etc. for ergonomic component authoring
 
 Inspired by htpy functional API with bracket notation support planned for Phase 2.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union, Callable
+import sys
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union, Callable
 
 
 # Type alias for VNode children (can be VNode or string)
 VNodeChild = Union["VNode", str]
 
+# Shared read-only props for every VNode created with props=None; compares
+# equal to {} and saves one empty dict per node
+_EMPTY_PROPS: Mapping[str, Any] = MappingProxyType({})
+
 
-@dataclass
 class VNode:
     """Virtual DOM node representation.
 
@@ -32,21 +39,155 @@ class VNode:
     - props keys starting with "on_" are event handlers (callable)
     - children can contain VNodes or strings (text nodes)
     - key is optional; required for list reconciliation in phase 3
+    - Equality is identity; compare fields explicitly when needed
 
     Attributes:
         tag: HTML tag name (e.g., "div", "button")
-        props: Dictionary of element properties and event handlers
-        children: List of child VNodes or text strings
+        props: Element properties and event handlers; the caller's dict
+            as given, or the shared read-only _EMPTY_PROPS when props is
+            None (copy before mutating)
+        children: Tuple of child VNodes or text strings
         key: Optional unique key for list reconciliation
         _el: Attached DOM element (client-side only, set by mount())
 
     SEE: shared.vdom.h, server.ssr.render-to-string, client.runtime.mount
     """
-    tag: str
-    props: Dict[str, Any] = field(default_factory=dict)
-    children: List[VNodeChild] = field(default_factory=list)
-    key: Optional[str] = None
-    _el: Any = None  # Attached DOM element (client-side only)
+
+    # WHY: Hand-written slots and __init__ instead of a dataclass; a node
+    # is built per element per render, and field-wise __eq__ is never
+    # needed for VDOM nodes
+    __slots__ = ("tag", "props", "children", "key", "_el", "_hash", "_props_hash")
+    __match_args__ = ("tag", "props", "children", "key")
+
+    def __init__(
+        self,
+        tag: str,
+        props: Mapping[str, Any] = _EMPTY_PROPS,
+        children: Tuple[VNodeChild, ...] = (),
+        key: Optional[str] = None,
+    ) -> None:
+        self.tag = tag
+        self.props = props
+        self.children = children
+        self.key = key
+        self._el: Any = None  # Attached DOM element (client-side only)
+        self._hash: Optional[int] = None  # Cached static_hash()
+        self._props_hash: Optional[int] = None  # Cached props_hash()
+
+    def __repr__(self) -> str:
+        return (f"VNode(tag={self.tag!r}, props={self.props!r}, "
+                f"children={self.children!r}, key={self.key!r})")
+
+    def static_hash(self) -> int:
+        """Hash of the whole subtree, computed once and cached.
+
+        Covers tag, key, props and children recursively. Event handlers
+        and other hashable values hash as themselves (functions by
+        identity); unhashable values such as style dicts hash by repr.
+
+        Returns:
+            Integer equal for structurally identical subtrees
+
+        SEE: shared.vdom.subtree_equal
+        """
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((
+                self.tag,
+                self.key,
+                self.props_hash(),
+                tuple([c.static_hash() if isinstance(c, VNode) else hash(c)
+                       for c in self.children]),
+            ))
+        return h
+
+    def props_hash(self) -> int:
+        """Hash of props alone, computed once and cached.
+
+        Value hashing follows static_hash, which reuses this result.
+
+        SEE: shared.vdom.props_equal
+        """
+        h = self._props_hash
+        if h is None:
+            h = self._props_hash = hash(
+                frozenset([(k, _value_hash(v)) for k, v in self.props.items()]))
+        return h
+
+
+def _value_hash(v: Any) -> int:
+    """Hash a prop value for static_hash, falling back to its repr."""
+    try:
+        return hash(v)
+    except TypeError:
+        return hash(repr(v))
+
+
+def subtree_equal(a: VNodeChild, b: VNodeChild) -> bool:
+    """Return True if two VDOM subtrees render identically.
+
+    WHY: Lets the patcher skip diffing an unchanged subtree. Cached hashes
+    only prove that two nodes differ (hashes collide, e.g. hash(-1) ==
+    hash(-2)); a match is confirmed by comparing tag, key, props and
+    children
+
+    SEE: shared.vdom.VNode.static_hash, client.runtime.patch
+    """
+    if a is b:
+        return True
+    if not (isinstance(a, VNode) and isinstance(b, VNode)):
+        return False
+
+    stack = [(a, b)]
+    while stack:
+        x, y = stack.pop()
+        if x is y:
+            continue
+        if x.static_hash() != y.static_hash():
+            return False
+        if (x.tag != y.tag or x.key != y.key
+                or len(x.children) != len(y.children)
+                or not _props_match(x.props, y.props)):
+            return False
+        for cx, cy in zip(x.children, y.children):
+            if isinstance(cx, VNode):
+                if not isinstance(cy, VNode):
+                    return False
+                stack.append((cx, cy))
+            elif not _value_match(cx, cy):
+                return False
+    return True
+
+
+def props_equal(a: VNode, b: VNode) -> bool:
+    """Return True if two VNodes carry equal props.
+
+    WHY: Differing cached props hashes rule out equality with one integer
+    compare; matching hashes are confirmed key by key
+
+    SEE: shared.vdom.VNode.props_hash, client.runtime.patch
+    """
+    if a.props is b.props:
+        return True
+    return a.props_hash() == b.props_hash() and _props_match(a.props, b.props)
+
+
+def _props_match(p: Mapping[str, Any], q: Mapping[str, Any]) -> bool:
+    """Compare two props mappings value by value (see _value_match)."""
+    if p is q:
+        return True
+    if len(p) != len(q):
+        return False
+    missing = object()
+    for k, v in p.items():
+        if not _value_match(v, q.get(k, missing)):
+            return False
+    return True
+
+
+def _value_match(x: Any, y: Any) -> bool:
+    """Equal and of the same type, so True/1/1.0 (rendered differently) differ."""
+    return x is y or (type(x) is type(y) and x == y)
 
 
 def h(tag: str, props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
@@ -62,23 +203,29 @@ def h(tag: str, props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -
 
     Examples:
         >>> h("div", {"class": "container"}, "Hello")
-        VNode(tag='div', props={'class': 'container'}, children=['Hello'])
+        VNode(tag='div', props={'class': 'container'}, children=('Hello',))
 
         >>> h("button", {"on_click": handler}, "Click me")
-        VNode(tag='button', props={'on_click': <function>}, children=['Click me'])
+        VNode(tag='button', props={'on_click': <function>}, children=('Click me',))
 
     SEE: shared.vdom.VNode, shared.vdom.div, tests.unit.test-vdom.TestHFunction
     """
+    # WHY: Interned tags make set/dict lookups by tag (e.g. SSR void tags)
+    # hit the identity fast path, including for runtime-built tag names.
+    # Positional args skip keyword matching, and the *children tuple is
+    # stored as-is rather than copied into a list
     return VNode(
-        tag=tag,
-        props=props or {},
-        children=list(children)
+        sys.intern(tag) if type(tag) is str else tag,
+        props if props is not None else _EMPTY_PROPS,
+        children,
     )
 
 
 # ANCHOR: shared.vdom.helpers
 # TITLE: HTML element helper functions
 # ROLE: vdom/ergonomics layer
+# NOTE: Helpers build VNode directly (same result as h()) to save a call
+#       frame and a varargs repack per node; literal tags are interned
 # SEE: shared.vdom.h, shared.vdom.VNode
 
 def div(props: Optional[Dict[str, Any]] = None, *children: VNodeChild, **kwargs) -> VNode:
@@ -95,43 +242,43 @@ def div(props: Optional[Dict[str, Any]] = None, *children: VNodeChild, **kwargs)
     SEE: shared.vdom.h
     """
     if 'children' in kwargs and not children:
-        children = tuple(kwargs['children']) if isinstance(kwargs['children'], list) else (kwargs['children'],)
-    return h("div", props, *children)
+        children = tuple(kwargs['children']) if isinstance(kwargs['children'], (list, tuple)) else (kwargs['children'],)
+    return VNode("div", props if props is not None else _EMPTY_PROPS, children)
 
 
 def button(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create button element. SEE: shared.vdom.h"""
-    return h("button", props, *children)
+    return VNode("button", props if props is not None else _EMPTY_PROPS, children)
 
 
 def span(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create span element. SEE: shared.vdom.h"""
-    return h("span", props, *children)
+    return VNode("span", props if props is not None else _EMPTY_PROPS, children)
 
 
 def h1(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create h1 heading element. SEE: shared.vdom.h"""
-    return h("h1", props, *children)
+    return VNode("h1", props if props is not None else _EMPTY_PROPS, children)
 
 
 def h2(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create h2 heading element. SEE: shared.vdom.h"""
-    return h("h2", props, *children)
+    return VNode("h2", props if props is not None else _EMPTY_PROPS, children)
 
 
 def h3(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create h3 heading element. SEE: shared.vdom.h"""
-    return h("h3", props, *children)
+    return VNode("h3", props if props is not None else _EMPTY_PROPS, children)
 
 
 def p(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create paragraph element. SEE: shared.vdom.h"""
-    return h("p", props, *children)
+    return VNode("p", props if props is not None else _EMPTY_PROPS, children)
 
 
 def a(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create anchor (link) element. SEE: shared.vdom.h"""
-    return h("a", props, *children)
+    return VNode("a", props if props is not None else _EMPTY_PROPS, children)
 
 
 def input_field(props: Optional[Dict[str, Any]] = None) -> VNode:
@@ -141,7 +288,7 @@ def input_field(props: Optional[Dict[str, Any]] = None) -> VNode:
 
     SEE: shared.vdom.h
     """
-    return h("input", props)
+    return VNode("input", props if props is not None else _EMPTY_PROPS, ())
 
 
 # Alias for input_field() - shorter name
@@ -150,109 +297,188 @@ input_ = input_field
 
 def textarea(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create textarea element. SEE: shared.vdom.h"""
-    return h("textarea", props, *children)
+    return VNode("textarea", props if props is not None else _EMPTY_PROPS, children)
 
 
 def select(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create select dropdown element. SEE: shared.vdom.h"""
-    return h("select", props, *children)
+    return VNode("select", props if props is not None else _EMPTY_PROPS, children)
 
 
 def option(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create option element (for select). SEE: shared.vdom.h"""
-    return h("option", props, *children)
+    return VNode("option", props if props is not None else _EMPTY_PROPS, children)
 
 
 def ul(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create unordered list element. SEE: shared.vdom.h"""
-    return h("ul", props, *children)
+    return VNode("ul", props if props is not None else _EMPTY_PROPS, children)
 
 
 def ol(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create ordered list element. SEE: shared.vdom.h"""
-    return h("ol", props, *children)
+    return VNode("ol", props if props is not None else _EMPTY_PROPS, children)
 
 
 def li(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create list item element. SEE: shared.vdom.h"""
-    return h("li", props, *children)
+    return VNode("li", props if props is not None else _EMPTY_PROPS, children)
 
 
 def img(props: Optional[Dict[str, Any]] = None) -> VNode:
     """Create img element (self-closing). SEE: shared.vdom.h"""
-    return h("img", props)
+    return VNode("img", props if props is not None else _EMPTY_PROPS, ())
 
 
 def br(props: Optional[Dict[str, Any]] = None) -> VNode:
     """Create br (line break) element (self-closing). SEE: shared.vdom.h"""
-    return h("br", props)
+    return VNode("br", props if props is not None else _EMPTY_PROPS, ())
 
 
 def hr(props: Optional[Dict[str, Any]] = None) -> VNode:
     """Create hr (horizontal rule) element (self-closing). SEE: shared.vdom.h"""
-    return h("hr", props)
+    return VNode("hr", props if props is not None else _EMPTY_PROPS, ())
 
 
 def form(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create form element. SEE: shared.vdom.h"""
-    return h("form", props, *children)
+    return VNode("form", props if props is not None else _EMPTY_PROPS, children)
 
 
 def label(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create label element. SEE: shared.vdom.h"""
-    return h("label", props, *children)
+    return VNode("label", props if props is not None else _EMPTY_PROPS, children)
 
 
 def table(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create table element. SEE: shared.vdom.h"""
-    return h("table", props, *children)
+    return VNode("table", props if props is not None else _EMPTY_PROPS, children)
 
 
 def tr(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create table row element. SEE: shared.vdom.h"""
-    return h("tr", props, *children)
+    return VNode("tr", props if props is not None else _EMPTY_PROPS, children)
 
 
 def td(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create table data cell element. SEE: shared.vdom.h"""
-    return h("td", props, *children)
+    return VNode("td", props if props is not None else _EMPTY_PROPS, children)
 
 
 def th(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create table header cell element. SEE: shared.vdom.h"""
-    return h("th", props, *children)
+    return VNode("th", props if props is not None else _EMPTY_PROPS, children)
 
 
 def nav(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create nav element. SEE: shared.vdom.h"""
-    return h("nav", props, *children)
+    return VNode("nav", props if props is not None else _EMPTY_PROPS, children)
 
 
 def header(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create header element. SEE: shared.vdom.h"""
-    return h("header", props, *children)
+    return VNode("header", props if props is not None else _EMPTY_PROPS, children)
 
 
 def footer(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create footer element. SEE: shared.vdom.h"""
-    return h("footer", props, *children)
+    return VNode("footer", props if props is not None else _EMPTY_PROPS, children)
 
 
 def section(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create section element. SEE: shared.vdom.h"""
-    return h("section", props, *children)
+    return VNode("section", props if props is not None else _EMPTY_PROPS, children)
 
 
 def article(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create article element. SEE: shared.vdom.h"""
-    return h("article", props, *children)
+    return VNode("article", props if props is not None else _EMPTY_PROPS, children)
 
 
 def main(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create main element. SEE: shared.vdom.h"""
-    return h("main", props, *children)
+    return VNode("main", props if props is not None else _EMPTY_PROPS, children)
 
 
 def aside(props: Optional[Dict[str, Any]] = None, *children: VNodeChild) -> VNode:
     """Create aside element. SEE: shared.vdom.h"""
-    return h("aside", props, *children)
+    return VNode("aside", props if props is not None else _EMPTY_PROPS, children)
+
+
+# ANCHOR: shared.vdom.memo
+# TITLE: Memoized VNode factories
+# ROLE: vdom/caching layer
+# SEE: shared.vdom.subtree_equal, shared.state.memo
+
+# Cached VNodes kept per memo_node()/memo_node_by() factory
+_MEMO_NODE_MAXSIZE = 4096
+
+
+def memo_node(fn: Callable[..., VNode]) -> Callable[..., VNode]:
+    """Cache a VNode factory by its (hashable) arguments.
+
+    Repeated calls with equal arguments return the same VNode object, so
+    unchanged list rows skip construction and patch() sees them as equal
+    subtrees by identity.
+
+    Args:
+        fn: Function returning a VNode; every argument must be hashable
+
+    Returns:
+        Cached wrapper (functools.lru_cache, maxsize _MEMO_NODE_MAXSIZE)
+
+    Caveats:
+        - Handlers captured by fn are frozen into the cached node; only
+          wrap factories whose closures are stable
+        - A cached node may change position or repeat between renders;
+          patch() mounts a copy of any node that is already mounted
+
+    Examples:
+        >>> Row = memo_node(lambda i: li({"key": f"item-{i}"}, f"Item {i}"))
+        >>> Row(1) is Row(1)
+        True
+
+    SEE: shared.vdom.memo_node_by, shared.state.memo
+    """
+    return lru_cache(maxsize=_MEMO_NODE_MAXSIZE)(fn)
+
+
+def memo_node_by(key_fn: Callable[..., Any]) -> Callable[[Callable[..., VNode]], Callable[..., VNode]]:
+    """Like memo_node, but cache by key_fn(*args, **kwargs).
+
+    For factories taking unhashable arguments (e.g. a todo dict) that are
+    identified by one stable field.
+
+    Args:
+        key_fn: Called with the factory's arguments; returns a hashable key
+
+    Returns:
+        Decorator producing the cached factory (least recently used entry
+        evicted first beyond _MEMO_NODE_MAXSIZE, like memo_node)
+
+    Examples:
+        >>> @memo_node_by(lambda todo: (todo["id"], todo["text"]))
+        ... def TodoRow(todo):
+        ...     return li({"key": todo["id"]}, todo["text"])
+
+    SEE: shared.vdom.memo_node
+    """
+    def decorator(fn: Callable[..., VNode]) -> Callable[..., VNode]:
+        # Least recently used first, matching memo_node's lru_cache
+        cache: OrderedDict[Any, VNode] = OrderedDict()
+
+        @wraps(fn)
+        def wrapped(*args: Any, **kwargs: Any) -> VNode:
+            key = key_fn(*args, **kwargs)
+            node = cache.get(key)
+            if node is None:
+                node = cache[key] = fn(*args, **kwargs)
+                if len(cache) > _MEMO_NODE_MAXSIZE:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+            return node
+
+        return wrapped
+
+    return decorator
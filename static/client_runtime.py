@@ -26,7 +26,7 @@ SEE: RESEARCH.md section 2 - PyScript pydom API
 """
 
 import js  # Pyodide JavaScript FFI
-from shared.vdom import VNode
+from shared.vdom import VNode, props_equal, subtree_equal
 from shared.state import ComponentInstance, render_component
 
 
@@ -122,8 +122,7 @@ def hydrate():
     # Phase 2: Clear existing content and mount fresh
     # Phase 3 will implement true hydration (reuse existing DOM)
     _root_element.innerHTML = ""
-    mount(_root_element, new_vdom)
-    _current_vdom = new_vdom
+    _current_vdom = mount(_root_element, new_vdom)
 
     # Wire schedule_update to trigger re-renders
     def schedule_update():
@@ -156,12 +155,16 @@ def mount(parent, vnode):
         parent: DOM element reference (parent container)
         vnode: VNode or string to mount
 
+    Returns:
+        The mounted VNode or string: vnode itself, or a shallow copy when
+        vnode is already mounted elsewhere (see _claim)
+
     Preconditions:
         - parent is valid DOM element reference
         - vnode is VNode or string
 
     Postconditions:
-        - vnode._el references created DOM element
+        - Returned VNode's _el references created DOM element
         - Element appended to parent
         - Event listeners attached for on_* props
 
@@ -180,9 +183,10 @@ def mount(parent, vnode):
         parent.appendChild(text_node)
         # For text nodes represented as strings, we can't set _el
         # This is fine for Phase 2
-        return
+        return vnode
 
     # Create element
+    vnode = _claim(vnode)
     el = js.document.createElement(vnode.tag)
     vnode._el = el  # Store reference for future patch operations
 
@@ -207,11 +211,43 @@ def mount(parent, vnode):
             el.setAttribute(k, str(v))
 
     # Mount children recursively
-    for child in (vnode.children or []):
-        mount(el, child)
+    children = vnode.children
+    if children:
+        mounted = None
+        for i, child in enumerate(children):
+            m = mount(el, child)
+            if m is not child:
+                if mounted is None:
+                    mounted = list(children)
+                mounted[i] = m
+        if mounted is not None:
+            vnode.children = tuple(mounted)
 
     # Append to parent
     parent.appendChild(el)
+    return vnode
+
+
+def _claim(vnode):
+    """Return vnode, or a shallow copy of it if it is already mounted.
+
+    WHY: Hoisted and memoized VNodes are reused across renders, so the
+    same object can sit in the old tree at one index and in the new tree
+    at another. Writing _el onto it would repoint the old tree's node
+    mid-patch, and a later remove or patch would hit the wrong element.
+    The copy shares props and children; only _el is per position
+
+    Args:
+        vnode: VNode about to receive a DOM reference
+
+    Returns:
+        vnode when its _el is unset, else a new VNode with the same fields
+
+    SEE: client.runtime.mount, client.runtime.patch, client.runtime.adopt_elements
+    """
+    if vnode._el is None:
+        return vnode
+    return VNode(vnode.tag, vnode.props, vnode.children, vnode.key)
 
 
 # ANCHOR: client.runtime.patch
@@ -230,11 +266,15 @@ def patch(parent, old_vnode, new_vnode, index=0):
 
     WHY: Efficient DOM updates minimize browser reflows/repaints
 
-    Algorithm:
-        1. Type changed → replace entire subtree
-        2. Text node → update textContent if different
-        3. Same tag → patch in place (props + children)
-        4. Different tag → replace node
+    Algorithm (numbers match the Case comments below):
+        1. One side None → mount new or remove old
+        2. Both None → nothing to do
+        3. Both text → update textContent if different
+        4. Text vs element → replace node
+        5. Different tag → replace node
+        6. Equal subtree (same object, or equal hash confirmed by a
+           structural compare) → reuse DOM as-is
+        7. Same tag → patch in place (props + children)
 
     Args:
         parent: DOM element reference (parent container)
@@ -242,12 +282,18 @@ def patch(parent, old_vnode, new_vnode, index=0):
         new_vnode: New VNode or string (can be None)
         index: Position in parent's children (for operations)
 
+    Returns:
+        The VNode or string now at this position: new_vnode, or a shallow
+        copy of it when new_vnode was already mounted elsewhere (see
+        _claim); None when the node was removed. Callers store it in
+        place of new_vnode
+
     Preconditions:
         - parent is valid DOM element reference
 
     Postconditions:
         - DOM updated to match new_vnode
-        - new_vnode._el references updated DOM element
+        - Returned VNode's _el references updated DOM element
 
     Side effects:
         - Updates DOM elements via js.document
@@ -258,16 +304,15 @@ def patch(parent, old_vnode, new_vnode, index=0):
     """
     # Case 1: One is None - add or remove
     if old_vnode is None and new_vnode is not None:
-        mount(parent, new_vnode)
-        return
+        return mount(parent, new_vnode)
 
     if old_vnode is not None and new_vnode is None:
         remove_node(parent, old_vnode, index)
-        return
+        return None
 
     # Case 2: Both None - nothing to do
     if old_vnode is None and new_vnode is None:
-        return
+        return None
 
     # Case 3: Text nodes
     if isinstance(old_vnode, str) and isinstance(new_vnode, str):
@@ -276,26 +321,35 @@ def patch(parent, old_vnode, new_vnode, index=0):
             if index < len(parent.childNodes):
                 text_node = parent.childNodes[index]
                 text_node.textContent = new_vnode
-        return
+        return new_vnode
 
     # Case 4: Text vs Element - replace
     if isinstance(old_vnode, str) != isinstance(new_vnode, str):
         remove_node(parent, old_vnode, index)
-        mount(parent, new_vnode)
-        return
+        return mount(parent, new_vnode)
 
     # Case 5: Different tags - replace
     if old_vnode.tag != new_vnode.tag:
         remove_node(parent, old_vnode, index)
-        mount(parent, new_vnode)
-        return
+        return mount(parent, new_vnode)
 
-    # Case 6: Same tag - patch in place
+    # Same object at the same position already owns its DOM
+    if old_vnode is new_vnode:
+        return new_vnode
+    new_vnode = _claim(new_vnode)
+
+    # Case 6: Unchanged subtree - hand over DOM references, skip the diff
+    if subtree_equal(old_vnode, new_vnode):
+        adopt_elements(old_vnode, new_vnode)
+        return new_vnode
+
+    # Case 7: Same tag - patch in place
     new_vnode._el = old_vnode._el
     element = old_vnode._el
 
-    # Patch props
-    patch_props(element, old_vnode.props or {}, new_vnode.props or {})
+    # Patch props (skipped when props are unchanged)
+    if not props_equal(old_vnode, new_vnode):
+        patch_props(element, old_vnode.props or {}, new_vnode.props or {})
 
     # Patch children
     old_children = old_vnode.children or []
@@ -311,10 +365,13 @@ def patch(parent, old_vnode, new_vnode, index=0):
 
     if has_keys:
         # Keyed children - use key-based reconciliation
-        patch_keyed_children(element, old_children, new_children)
+        children = patch_keyed_children(element, old_children, new_children)
     else:
         # Non-keyed children - patch by index
-        patch_children(element, old_children, new_children)
+        children = patch_children(element, old_children, new_children)
+    if children is not new_children:
+        new_vnode.children = children
+    return new_vnode
 
 
 def patch_props(element, old_props, new_props):
@@ -410,6 +467,10 @@ def patch_children(parent, old_children, new_children):
         old_children: List of old VNodes/strings
         new_children: List of new VNodes/strings
 
+    Returns:
+        new_children, or a tuple with copies in place of children that
+        patch()/mount() had to copy
+
     Side effects:
         - Patches existing children via patch()
         - Removes extra old children
@@ -419,10 +480,16 @@ def patch_children(parent, old_children, new_children):
     """
     old_len = len(old_children)
     new_len = len(new_children)
+    placed = None
 
     # Patch common children at same index
     for i in range(min(old_len, new_len)):
-        patch(parent, old_children[i], new_children[i], i)
+        child = new_children[i]
+        result = patch(parent, old_children[i], child, i)
+        if result is not child:
+            if placed is None:
+                placed = list(new_children)
+            placed[i] = result
 
     # Remove extra old children
     for i in range(new_len, old_len):
@@ -430,7 +497,14 @@ def patch_children(parent, old_children, new_children):
 
     # Add extra new children
     for i in range(old_len, new_len):
-        mount(parent, new_children[i])
+        child = new_children[i]
+        result = mount(parent, child)
+        if result is not child:
+            if placed is None:
+                placed = list(new_children)
+            placed[i] = result
+
+    return new_children if placed is None else tuple(placed)
 
 
 def patch_keyed_children(parent, old_children, new_children):
@@ -456,6 +530,10 @@ def patch_keyed_children(parent, old_children, new_children):
     Preconditions:
         - All children have key property set
 
+    Returns:
+        new_children, or a tuple with copies in place of children that
+        patch()/mount() had to copy
+
     Side effects:
         - Patches existing keyed children via patch()
         - Moves DOM elements to match new order
@@ -477,6 +555,7 @@ def patch_keyed_children(parent, old_children, new_children):
 
     # Track which old children to remove
     used_keys = set()
+    placed = None
 
     # First pass: update/move existing keyed children
     for new_idx, new_child in enumerate(new_children):
@@ -489,17 +568,22 @@ def patch_keyed_children(parent, old_children, new_children):
         if key in old_keyed:
             old_idx, old_child = old_keyed[key]
             # Patch the matching child
-            patch(parent, old_child, new_child, new_idx)
+            result = patch(parent, old_child, new_child, new_idx)
 
             # Move if position changed
             if old_idx != new_idx:
-                move_node(parent, new_child._el, new_idx)
+                move_node(parent, result._el, new_idx)
         else:
             # New child - mount it
-            mount(parent, new_child)
+            result = mount(parent, new_child)
             # Move to correct position
             if new_idx < len(parent.childNodes):
-                move_node(parent, new_child._el, new_idx)
+                move_node(parent, result._el, new_idx)
+
+        if result is not new_child:
+            if placed is None:
+                placed = list(new_children)
+            placed[new_idx] = result
 
     # Second pass: remove old children not in new
     for key in old_keyed:
@@ -507,6 +591,8 @@ def patch_keyed_children(parent, old_children, new_children):
             _, old_child = old_keyed[key]
             remove_node(parent, old_child, 0)  # Index doesn't matter for removal
 
+    return new_children if placed is None else tuple(placed)
+
 
 def remove_node(parent, vnode, index):
     """Remove a node from DOM.
@@ -528,6 +614,39 @@ def remove_node(parent, vnode, index):
         vnode._el.remove()
 
 
+def adopt_elements(old_vnode, new_vnode):
+    """Copy DOM references from an equal old subtree onto the new one.
+
+    Args:
+        old_vnode: Mounted VNode
+        new_vnode: Unmounted VNode (see _claim), not old_vnode, for which
+            subtree_equal(old_vnode, new_vnode)
+
+    Postconditions:
+        - Every VNode in new_vnode's subtree has _el set
+        - Descendants already mounted elsewhere are replaced by copies in
+          their parent's children
+
+    SEE: client.runtime.patch, client.runtime._claim, shared.vdom.subtree_equal
+    """
+    stack = [(old_vnode, new_vnode)]
+    while stack:
+        old, new = stack.pop()
+        new._el = old._el
+        children = new.children
+        placed = None
+        for i, (old_child, new_child) in enumerate(zip(old.children, children)):
+            if old_child is new_child or not isinstance(new_child, VNode):
+                continue
+            if new_child._el is not None:
+                if placed is None:
+                    placed = list(children)
+                new_child = placed[i] = _claim(new_child)
+            stack.append((old_child, new_child))
+        if placed is not None:
+            new.children = tuple(placed)
+
+
 def move_node(parent, element, new_index):
     """Move an element to a new position in parent.
 
@@ -598,9 +717,7 @@ def rerender():
 
     # Phase 3: Intelligent patching
     # Use patch() to update only changed nodes
-    patch(_root_element, _current_vdom, new_vdom)
-
-    # Update stored VDOM for next render
-    _current_vdom = new_vdom
+    # Update stored VDOM for next render (patch may return a copy)
+    _current_vdom = patch(_root_element, _current_vdom, new_vdom)
 
     print(f"🔄 Re-rendered (state: {_root_instance.state})")
@@ -23,10 +23,72 @@ SEE: server.app.route_handler (loads initial data), client.actions.get_todos
 """
 
 from shared.vdom import div, h1, h2, p, button, span, a
-from shared.state import use_state
+from shared.state import use_state, batch
 import asyncio
 
 
+# ANCHOR: pages.dashboard.static
+# Static sections shared across renders (no state or props dependency)
+# Per render, only the stat numbers, loading flag, and error are built
+
+_NAV = div({"class": "nav"},
+    a({"href": "/", "class": "nav-link"}, "Home"),
+    span({}, " | "),
+    a({"href": "/about", "class": "nav-link"}, "About"),
+    span({}, " | "),
+    a({"href": "/todos", "class": "nav-link"}, "Todos"),
+    span({}, " | "),
+    a({"href": "/dashboard", "class": "nav-link active"}, "Dashboard"),
+)
+
+_TITLE = h1({"class": "title"}, "📊 Dashboard")
+
+_SUBTITLE = p({"class": "subtitle"},
+    "Real-time todo statistics with ",
+    span({"class": "highlight"}, "SSR data loading"),
+    " and ",
+    span({"class": "highlight"}, "client-side refresh"),
+    "."
+)
+
+# Stat card labels; only the numbers next to them vary per render
+_LABEL_TOTAL = span({"class": "stat-label"}, " total todos")
+_LABEL_DONE = span({"class": "stat-label"}, " completed")
+_LABEL_ACTIVE = span({"class": "stat-label"}, " active")
+
+_INFO_SECTION = div({"class": "section"},
+    h2({}, "How it works"),
+    p({},
+        "💡 ",
+        span({"class": "highlight"}, "Server-Side Rendering (SSR): "),
+        "When you first load this page, the server fetches todo data and passes it as ",
+        span({"class": "code"}, "props"),
+        " to the component. This provides fast initial load and SEO benefits."
+    ),
+    p({},
+        "🔄 ",
+        span({"class": "highlight"}, "Client-Side Refresh: "),
+        "Click the Refresh button to fetch fresh data from the server using the ",
+        span({"class": "code"}, "client.actions"),
+        " module. This demonstrates async data loading in Pyodide."
+    ),
+    p({},
+        "🎯 ",
+        span({"class": "highlight"}, "Loading States: "),
+        "The component tracks loading state and disables the button during fetch operations. ",
+        "Errors are caught and displayed to the user."
+    ),
+)
+
+_PAGE_NAV = div({"class": "page-nav"},
+    p({},
+        "Try modifying todos on the ",
+        a({"href": "/todos", "class": "page-link"}, "Todos page"),
+        " then come back and refresh this dashboard to see updated stats!"
+    )
+)
+
+
 def DashboardPage(props: dict):
     """Dashboard page showing todo statistics.
 
@@ -71,9 +133,13 @@ def DashboardPage(props: dict):
 
         SEE: client.actions.get_todos
         """
-        set_loading(True)
-        set_error(None)
+        # One render to show the loading state...
+        with batch():
+            set_loading(True)
+            set_error(None)
 
+        new_stats = None
+        error_msg = None
         try:
             # Import client actions (only available in browser/Pyodide)
             from client.actions import get_todos
@@ -87,16 +153,21 @@ def DashboardPage(props: dict):
                 'done': sum(1 for t in todos if t['done']),
                 'active': sum(1 for t in todos if not t['done']),
             }
-            set_stats(new_stats)
 
         except Exception as e:
             # Handle errors (network failures, server errors)
             error_msg = f"Failed to load data: {str(e)}"
-            set_error(error_msg)
             print(f"❌ {error_msg}")
 
         finally:
-            set_loading(False)
+            # ...and one render for the outcome. Cancellation lands here
+            # too, so loading is always cleared.
+            with batch():
+                if new_stats is not None:
+                    set_stats(new_stats)
+                if error_msg is not None:
+                    set_error(error_msg)
+                set_loading(False)
 
     def handle_refresh(event):
         """Handle refresh button click.
@@ -109,42 +180,24 @@ def DashboardPage(props: dict):
         asyncio.create_task(refresh_data())
 
     # Build UI
-    return div({"class": "container"},
-        # Navigation
-        div({"class": "nav"},
-            a({"href": "/", "class": "nav-link"}, "Home"),
-            span({}, " | "),
-            a({"href": "/about", "class": "nav-link"}, "About"),
-            span({}, " | "),
-            a({"href": "/todos", "class": "nav-link"}, "Todos"),
-            span({}, " | "),
-            a({"href": "/dashboard", "class": "nav-link active"}, "Dashboard"),
-        ),
-
-        # Header
-        h1({"class": "title"}, "📊 Dashboard"),
-
-        p({"class": "subtitle"},
-            "Real-time todo statistics with ",
-            span({"class": "highlight"}, "SSR data loading"),
-            " and ",
-            span({"class": "highlight"}, "client-side refresh"),
-            "."
-        ),
+    children = [
+        _NAV,
+        _TITLE,
+        _SUBTITLE,
 
         # Statistics cards
         div({"class": "todo-stats"},
             div({"class": "stat"},
                 span({"class": "stat-number"}, str(stats['total'])),
-                span({"class": "stat-label"}, " total todos")
+                _LABEL_TOTAL
             ),
             div({"class": "stat"},
                 span({"class": "stat-number"}, str(stats['done'])),
-                span({"class": "stat-label"}, " completed")
+                _LABEL_DONE
             ),
             div({"class": "stat"},
                 span({"class": "stat-number"}, str(stats['active'])),
-                span({"class": "stat-label"}, " active")
+                _LABEL_ACTIVE
             ),
         ),
 
@@ -160,43 +213,14 @@ def DashboardPage(props: dict):
                 "🔄 Refresh Data" if not loading else "⏳ Loading..."
             ),
         ),
+    ]
 
-        # Error message
-        (div({"class": "status"},
+    # Error message (only present when set; children never contain None)
+    if error:
+        children.append(div({"class": "status"},
             p({}, f"❌ Error: {error}")
-        ) if error else None),
-
-        # Info section
-        div({"class": "section"},
-            h2({}, "How it works"),
-            p({},
-                "💡 ",
-                span({"class": "highlight"}, "Server-Side Rendering (SSR): "),
-                "When you first load this page, the server fetches todo data and passes it as ",
-                span({"class": "code"}, "props"),
-                " to the component. This provides fast initial load and SEO benefits."
-            ),
-            p({},
-                "🔄 ",
-                span({"class": "highlight"}, "Client-Side Refresh: "),
-                "Click the Refresh button to fetch fresh data from the server using the ",
-                span({"class": "code"}, "client.actions"),
-                " module. This demonstrates async data loading in Pyodide."
-            ),
-            p({},
-                "🎯 ",
-                span({"class": "highlight"}, "Loading States: "),
-                "The component tracks loading state and disables the button during fetch operations. ",
-                "Errors are caught and displayed to the user."
-            ),
-        ),
+        ))
 
-        # Navigation links
-        div({"class": "page-nav"},
-            p({},
-                "Try modifying todos on the ",
-                a({"href": "/todos", "class": "page-link"}, "Todos page"),
-                " then come back and refresh this dashboard to see updated stats!"
-            )
-        ),
-    )
+    children.extend((_INFO_SECTION, _PAGE_NAV))
+
+    return div({"class": "container"}, *children)
@@ -35,7 +35,19 @@ from playwright.async_api import async_playwright, Page, ConsoleMessage
 # ROLE: test infrastructure
 
 @pytest_asyncio.fixture(scope="session")
-async def browser_context():
+async def _console_queue():
+    """
+    Session-scoped queue receiving every console message from the context.
+
+    WHY: One persistent listener replaces per-test page.on("console") wiring
+
+    SEE: tests.e2e.phase1-browser.browser_context, tests.e2e.phase1-browser.console_queue
+    """
+    return asyncio.Queue()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def browser_context(_console_queue):
     """
     Session-scoped browser context for E2E tests.
 
@@ -44,6 +56,7 @@ async def browser_context():
     INVARIANTS:
     - Chromium browser launched in headless mode
     - Context isolated per test run
+    - Console messages from all pages pushed to _console_queue
     - Cleanup after all session tests complete
 
     SEE: tests.e2e.phase1-browser.test-*, RESEARCH.md section 6
@@ -51,11 +64,45 @@ async def browser_context():
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
         context = await browser.new_context()
+        context.on("console", _console_queue.put_nowait)
         yield context
         await context.close()
         await browser.close()
 
 
+@pytest_asyncio.fixture
+async def console_queue(_console_queue):
+    """
+    Per-test view of the context console queue.
+
+    WHY: Discard messages left over from earlier tests so each test only
+    sees console output from its own navigation
+
+    SEE: tests.e2e.phase1-browser.drain_console
+    """
+    while not _console_queue.empty():
+        _console_queue.get_nowait()
+    return _console_queue
+
+
+async def drain_console(queue: asyncio.Queue, idle: float = 0.1) -> list[ConsoleMessage]:
+    """
+    Collect console messages until none arrive for `idle` seconds.
+
+    WHY: Replaces a fixed sleep with a wait that ends as soon as the
+    console goes quiet
+
+    SEE: tests.e2e.phase1-browser.console_queue
+    """
+    messages = []
+    try:
+        while True:
+            messages.append(await asyncio.wait_for(queue.get(), timeout=idle))
+    except asyncio.TimeoutError:
+        pass
+    return messages
+
+
 @pytest_asyncio.fixture
 async def page(browser_context):
     """
@@ -82,7 +129,6 @@ async def page(browser_context):
 class TestSSRRenders:
     """Test server-side rendering loads before JavaScript execution."""
 
-    @pytest.mark.asyncio
     async def test_ssr_content_loads_first(self, page: Page):
         """
         Verify SSR content is present before JavaScript executes.
@@ -108,7 +154,6 @@ class TestSSRRenders:
         assert "Welcome to Pickle-Reactor" in content
         assert "Phase 1" in content
 
-    @pytest.mark.asyncio
     async def test_ssr_html_structure_valid(self, page: Page):
         """
         Verify SSR HTML has correct structure.
@@ -117,7 +162,9 @@ class TestSSRRenders:
 
         SEE: server.app.home
         """
-        await page.goto("http://localhost:8000")
+        # SSR-only: don't wait for subresources, just for #root to be parsed
+        await page.goto("http://localhost:8000", wait_until="commit")
+        await page.wait_for_selector("#root", state="attached")
 
         # Check HTML structure
         assert await page.locator("html").count() == 1
@@ -125,7 +172,6 @@ class TestSSRRenders:
         assert await page.locator("body").count() == 1
         assert await page.locator("#root").count() == 1
 
-    @pytest.mark.asyncio
     async def test_ssr_contains_expected_elements(self, page: Page):
         """
         Verify SSR renders all expected page elements.
@@ -134,7 +180,9 @@ class TestSSRRenders:
 
         SEE: pages.index.IndexPage
         """
-        await page.goto("http://localhost:8000")
+        # SSR-only: #pyodide-status is the last IndexPage element parsed
+        await page.goto("http://localhost:8000", wait_until="commit")
+        await page.wait_for_selector("#pyodide-status", state="attached")
 
         # Check for key elements from IndexPage
         assert await page.locator(".container").count() >= 1
@@ -142,7 +190,6 @@ class TestSSRRenders:
         assert await page.locator(".features").count() >= 1
         assert await page.locator("#pyodide-status").count() == 1
 
-    @pytest.mark.asyncio
     async def test_ssr_includes_bootstrap_script(self, page: Page):
         """
         Verify SSR HTML includes bootstrap.js script tag.
@@ -166,7 +213,6 @@ class TestSSRRenders:
 class TestPyodideLoads:
     """Test Pyodide loads and initializes successfully."""
 
-    @pytest.mark.asyncio
     async def test_pyodide_loads_successfully(self, page: Page):
         """
         Verify Pyodide loads and initialization completes.
@@ -201,7 +247,6 @@ class TestPyodideLoads:
         status = await page.locator("#pyodide-status").text_content()
         assert "✅" in status or "Pyodide loaded successfully" in status
 
-    @pytest.mark.asyncio
     async def test_pyodide_status_updates(self, page: Page):
         """
         Verify status element updates during Pyodide loading.
@@ -235,8 +280,7 @@ class TestPyodideLoads:
 class TestConsoleMessages:
     """Test console messages during initialization."""
 
-    @pytest.mark.asyncio
-    async def test_no_console_errors(self, page: Page):
+    async def test_no_console_errors(self, page: Page, console_queue: asyncio.Queue):
         """
         Verify no console errors during initialization.
 
@@ -248,20 +292,6 @@ class TestConsoleMessages:
 
         SEE: PLAN.md Phase 1→2 quality gates
         """
-        # Collect console messages
-        console_messages = []
-        error_messages = []
-
-        def handle_console(msg: ConsoleMessage):
-            console_messages.append({
-                "type": msg.type,
-                "text": msg.text
-            })
-            if msg.type == "error":
-                error_messages.append(msg.text)
-
-        page.on("console", handle_console)
-
         # Navigate and wait for Pyodide
         await page.goto("http://localhost:8000")
         await page.wait_for_function(
@@ -269,19 +299,19 @@ class TestConsoleMessages:
             timeout=15000
         )
 
-        # Give a moment for any delayed errors
-        await asyncio.sleep(0.5)
+        # Collect console messages, including any delayed errors
+        console_messages = await drain_console(console_queue)
+        error_messages = [m.text for m in console_messages if m.type == "error"]
 
         # Verify no errors
         if error_messages:
-            all_messages = "\n".join([f"{m['type']}: {m['text']}" for m in console_messages])
+            all_messages = "\n".join([f"{m.type}: {m.text}" for m in console_messages])
             pytest.fail(
                 f"Console errors detected:\n{chr(10).join(error_messages)}\n\n"
                 f"All console messages:\n{all_messages}"
             )
 
-    @pytest.mark.asyncio
-    async def test_console_success_messages(self, page: Page):
+    async def test_console_success_messages(self, page: Page, console_queue: asyncio.Queue):
         """
         Verify expected console success messages appear.
 
@@ -295,14 +325,6 @@ class TestConsoleMessages:
 
         SEE: static.bootstrap.js
         """
-        # Collect console messages
-        console_messages = []
-
-        def handle_console(msg: ConsoleMessage):
-            console_messages.append(msg.text)
-
-        page.on("console", handle_console)
-
         # Navigate and wait
         await page.goto("http://localhost:8000")
         await page.wait_for_function(
@@ -310,8 +332,8 @@ class TestConsoleMessages:
             timeout=15000
         )
 
-        # Give time for all console messages
-        await asyncio.sleep(0.5)
+        # Collect console messages until the console goes quiet
+        console_messages = [m.text for m in await drain_console(console_queue)]
 
         # Join all messages for easier searching
         all_logs = "\n".join(console_messages)
@@ -335,7 +357,6 @@ class TestConsoleMessages:
 class TestPerformanceBudget:
     """Test performance stays within Phase 1 budgets."""
 
-    @pytest.mark.asyncio
     async def test_pyodide_load_time_budget(self, page: Page):
         """
         Verify Pyodide loads within reasonable time budget.
@@ -367,7 +388,6 @@ class TestPerformanceBudget:
 
         print(f"✅ Pyodide loaded in {load_time_ms:.0f}ms (budget: 10000ms)")
 
-    @pytest.mark.asyncio
     async def test_page_load_performance_measured(self, page: Page):
         """
         Measure and log page load performance metrics.
@@ -411,7 +431,6 @@ class TestPerformanceBudget:
 class TestReliability:
     """Test suite reliability and stability."""
 
-    @pytest.mark.asyncio
     async def test_multiple_page_loads(self, page: Page):
         """
         Verify tests are reliable across multiple page loads.
@@ -437,7 +456,6 @@ class TestReliability:
 
             print(f"✅ Load {i+1}/3 successful")
 
-    @pytest.mark.asyncio
     async def test_no_race_conditions_in_bootstrap(self, page: Page):
         """
         Verify bootstrap.js has no race conditions.
@@ -470,7 +488,6 @@ class TestReliability:
 class TestMobileViewport:
     """Test mobile viewport and responsive behavior."""
 
-    @pytest.mark.asyncio
     async def test_mobile_viewport_configured(self, page: Page):
         """
         Verify mobile viewport meta tag present.
@@ -479,13 +496,14 @@ class TestMobileViewport:
 
         SEE: server.app.home HTML shell
         """
-        await page.goto("http://localhost:8000")
+        # SSR-only: the meta tag is in <head>, no need to wait for load
+        await page.goto("http://localhost:8000", wait_until="commit")
+        await page.wait_for_selector('meta[name="viewport"]', state="attached")
 
         # Check viewport meta tag
         viewport_meta = await page.locator('meta[name="viewport"]').count()
         assert viewport_meta == 1
 
-    @pytest.mark.asyncio
     async def test_content_readable_on_mobile(self, page: Page):
         """
         Verify content is readable on mobile viewport.
@@ -0,0 +1,172 @@
+# ANCHOR: tests.integration.conftest
+# TITLE: Integration test configuration and fixtures
+# ROLE: testing/integration infrastructure
+# EXPORTS: client fixture, rendered_pages fixture, reset_db fixture, RawResponse, RenderedPage, raw_get
+# SEE: tests.integration.test-server, tests.integration.test-actions, tests.integration.test-server-routing
+
+"""
+Shared fixtures for integration tests.
+
+Provides:
+- Session-scoped httpx AsyncClient bound to the FastAPI app
+- Session-scoped responses for the read-only routes (rendered_pages),
+  fetched with raw_get straight through the ASGI interface
+- reset_db, which tests that mutate the todo store request explicitly
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from server.actions import _reset_database
+from server.app import app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Test client for FastAPI app, shared by the whole session.
+
+    Uses httpx AsyncClient with ASGITransport for testing ASGI apps.
+    No actual HTTP server needed - direct ASGI invocation.
+
+    WHY: One transport and client context for all integration tests
+    instead of one per test
+
+    SEE: https://www.python-httpx.org/async/#calling-into-python-web-apps
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture
+def reset_db():
+    """Reset database around a test that mutates it.
+
+    WHY: Mutating tests start from the initial todos and restore them on
+    teardown, so read-only tests can rely on the session-fresh state
+    without resetting at all
+
+    SEE: server.actions._reset_database
+    """
+    _reset_database()
+    yield
+    _reset_database()
+
+
+class RawResponse(NamedTuple):
+    """Status, headers and body of a request made with raw_get.
+
+    Field names match httpx.Response so read-only assertions work
+    against either.
+    """
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+
+
+async def raw_get(path: str) -> RawResponse:
+    """Issue a GET by calling the ASGI app directly.
+
+    WHY: Read-only tests only check status, headers and body substrings;
+    a minimal HTTP scope skips httpx request/response construction,
+    cookie handling and header normalisation
+
+    Args:
+        path: Request path (no query string)
+
+    Returns:
+        RawResponse with lower-cased header names
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 123),
+        "server": ("test", 80),
+    }
+    status = 0
+    headers: dict[str, str] = {}
+    chunks: list[bytes] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for name, value in message.get("headers", ()):
+                headers[name.decode("latin-1").lower()] = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return RawResponse(status, headers, b"".join(chunks))
+
+
+@dataclass(frozen=True)
+class RenderedPage:
+    """Cached response with its body pre-decoded for assertions.
+
+    WHY: Many tests read the same cached response; decoding JSON and
+    lower-casing the body once per route keeps that work out of every
+    assertion
+
+    Attributes:
+        status_code: HTTP status
+        headers: Lower-cased header names -> values
+        content: Raw body bytes
+        parsed: Decoded JSON body, or None for non-JSON responses
+        body_lower: Lower-cased text body
+    """
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    parsed: Any
+    body_lower: str
+
+    @classmethod
+    def from_raw(cls, raw: RawResponse) -> "RenderedPage":
+        """Build from a RawResponse, decoding the body once."""
+        is_json = "json" in raw.headers.get("content-type", "")
+        text = raw.content.decode()
+        return cls(
+            status_code=raw.status_code,
+            headers=raw.headers,
+            content=raw.content,
+            parsed=json.loads(text) if is_json else None,
+            body_lower=text.lower(),
+        )
+
+
+# Read-only routes whose responses never change within a session
+_CACHED_PATHS = ("/", "/about", "/todos", "/health", "/static/bootstrap.js")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def rendered_pages():
+    """Responses for the read-only routes, fetched once per session.
+
+    WHY: Dozens of read-only tests assert against identical SSR output;
+    rendering each route once and sharing the response removes the
+    repeated renders
+
+    Returns:
+        dict mapping path -> RenderedPage
+    """
+    responses = await asyncio.gather(*(raw_get(p) for p in _CACHED_PATHS))
+    return {p: RenderedPage.from_raw(r) for p, r in zip(_CACHED_PATHS, responses)}
@@ -16,37 +16,17 @@ Tests complete HTTP request/response cycle for todos API:
 - Error handling (404, validation errors)
 """
 
-import pytest
-from httpx import AsyncClient, ASGITransport
-from server.app import app
-from server.actions import _reset_database
-
-
-@pytest.fixture(autouse=True)
-def reset_database():
-    """Reset database before each test.
-
-    WHY: Ensure clean state for each test
-
-    SEE: server.actions._reset_database
-    """
-    _reset_database()
-
+import asyncio
 
-@pytest.fixture
-async def client():
-    """Create async test client with ASGITransport.
+import pytest
 
-    WHY: httpx AsyncClient requires ASGITransport for ASGI apps
 
-    SEE: tests.integration.test-server
-    """
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+def by_id(todos):
+    """Index a todo list payload by id for O(1) lookups."""
+    return {t["id"]: t for t in todos}
 
 
-@pytest.mark.asyncio
+@pytest.mark.xdist_group(name="db_mutations")
 class TestListTodos:
     """Test GET /api/todos endpoint."""
 
@@ -70,12 +50,11 @@ class TestListTodos:
         assert data["todos"][1]["text"] == "Build VDOM diffing"
         assert data["todos"][1]["done"] is True
 
+    @pytest.mark.usefixtures("reset_db")
     async def test_list_todos_empty_after_deletions(self, client):
         """List todos returns empty array after all deleted."""
         # Delete all todos
-        await client.delete("/api/todos/1")
-        await client.delete("/api/todos/2")
-        await client.delete("/api/todos/3")
+        await asyncio.gather(*(client.delete(f"/api/todos/{i}") for i in (1, 2, 3)))
 
         response = await client.get("/api/todos")
 
@@ -84,7 +63,8 @@ class TestListTodos:
         assert data["todos"] == []
 
 
-@pytest.mark.asyncio
+@pytest.mark.xdist_group(name="db_mutations")
+@pytest.mark.usefixtures("reset_db")
 class TestCreateTodo:
     """Test POST /api/todos endpoint."""
 
@@ -125,24 +105,20 @@ class TestCreateTodo:
         todos = list_response.json()["todos"]
         assert len(todos) == 4  # 3 initial + 1 new
 
-        new_todo = next(t for t in todos if t["text"] == "Persisted todo")
-        assert new_todo["id"] == 4
+        new_todo = by_id(todos)[4]
+        assert new_todo["text"] == "Persisted todo"
         assert new_todo["done"] is False
 
-    async def test_create_todo_empty_text_validation_error(self, client):
-        """Empty text triggers validation error."""
-        response = await client.post("/api/todos", json={"text": ""})
+    @pytest.mark.parametrize("body", [{"text": ""}, {}], ids=["empty", "missing"])
+    async def test_create_todo_validation_error(self, client, body):
+        """Empty or missing text triggers validation error."""
+        response = await client.post("/api/todos", json=body)
 
         assert response.status_code == 422  # Validation error
 
-    async def test_create_todo_missing_text_validation_error(self, client):
-        """Missing text field triggers validation error."""
-        response = await client.post("/api/todos", json={})
-
-        assert response.status_code == 422
-
 
-@pytest.mark.asyncio
+@pytest.mark.xdist_group(name="db_mutations")
+@pytest.mark.usefixtures("reset_db")
 class TestUpdateTodo:
     """Test PUT /api/todos/{id} endpoint."""
 
@@ -181,8 +157,7 @@ class TestUpdateTodo:
         list_response = await client.get("/api/todos")
 
         todos = list_response.json()["todos"]
-        todo1 = next(t for t in todos if t["id"] == 1)
-        assert todo1["done"] is True
+        assert by_id(todos)[1]["done"] is True
 
     async def test_update_todo_not_found(self, client):
         """Update non-existent todo returns 404."""
@@ -195,14 +170,16 @@ class TestUpdateTodo:
         data = response.json()
         assert "not found" in data["detail"].lower()
 
-    async def test_update_todo_missing_done_field(self, client):
-        """Update without done field triggers validation error."""
-        response = await client.put("/api/todos/1", json={})
+    @pytest.mark.parametrize("body", [{}, {"done": None}], ids=["missing", "null"])
+    async def test_update_todo_validation_error(self, client, body):
+        """Missing or null done field triggers validation error."""
+        response = await client.put("/api/todos/1", json=body)
 
         assert response.status_code == 422
 
 
-@pytest.mark.asyncio
+@pytest.mark.xdist_group(name="db_mutations")
+@pytest.mark.usefixtures("reset_db")
 class TestDeleteTodo:
     """Test DELETE /api/todos/{id} endpoint."""
 
@@ -221,7 +198,7 @@ class TestDeleteTodo:
 
         todos = list_response.json()["todos"]
         assert len(todos) == 2  # 3 - 1
-        assert not any(t["id"] == 1 for t in todos)
+        assert 1 not in by_id(todos)
 
     async def test_delete_todo_not_found(self, client):
         """Delete non-existent todo returns 404."""
@@ -232,9 +209,8 @@ class TestDeleteTodo:
         assert "not found" in data["detail"].lower()
 
     async def test_delete_todo_multiple(self, client):
-        """Delete multiple todos in sequence."""
-        await client.delete("/api/todos/1")
-        await client.delete("/api/todos/2")
+        """Delete multiple todos concurrently."""
+        await asyncio.gather(client.delete("/api/todos/1"), client.delete("/api/todos/2"))
         list_response = await client.get("/api/todos")
 
         todos = list_response.json()["todos"]
@@ -242,7 +218,8 @@ class TestDeleteTodo:
         assert todos[0]["id"] == 3
 
 
-@pytest.mark.asyncio
+@pytest.mark.xdist_group(name="db_mutations")
+@pytest.mark.usefixtures("reset_db")
 class TestCRUDWorkflow:
     """Test complete CRUD workflow."""
 
@@ -258,7 +235,7 @@ class TestCRUDWorkflow:
         # Read (list)
         list_resp = await client.get("/api/todos")
         todos = list_resp.json()["todos"]
-        assert any(t["id"] == todo_id for t in todos)
+        assert todo_id in by_id(todos)
 
         # Update
         update_resp = await client.put(
@@ -274,4 +251,4 @@ class TestCRUDWorkflow:
         # Verify deleted
         final_list_resp = await client.get("/api/todos")
         final_todos = final_list_resp.json()["todos"]
-        assert not any(t["id"] == todo_id for t in final_todos)
+        assert todo_id not in by_id(final_todos)
@@ -13,222 +13,208 @@ Tests cover:
 - Static file serving
 - Response headers (content-type, etc.)
 - Health check endpoint
+- Dashboard ETag caching
 """
 
 import pytest
-import pytest_asyncio
-from httpx import AsyncClient, ASGITransport
-from server.app import app
-
-
-@pytest_asyncio.fixture
-async def client():
-    """Test client for FastAPI app.
-
-    Uses httpx AsyncClient with ASGITransport for testing ASGI apps.
-    No actual HTTP server needed - direct ASGI invocation.
-
-    SEE: https://www.python-httpx.org/async/#calling-into-python-web-apps
-    """
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
 
 
 class TestHomeRoute:
     """Test GET / route with SSR."""
 
-    @pytest.mark.asyncio
-    async def test_home_returns_html(self, client):
+    async def test_home_returns_html(self, rendered_pages):
         """GET / returns HTML with 200 status."""
-        response = await client.get("/")
+        response = rendered_pages["/"]
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
-    @pytest.mark.asyncio
-    async def test_home_contains_doctype(self, client):
+    async def test_home_contains_doctype(self, rendered_pages):
         """GET / returns valid HTML with DOCTYPE."""
-        response = await client.get("/")
-        html = response.text
-        assert html.startswith("<!DOCTYPE html>")
+        response = rendered_pages["/"]
+        html = response.content
+        assert html.startswith(b"<!DOCTYPE html>")
 
-    @pytest.mark.asyncio
-    async def test_home_contains_root_div(self, client):
+    async def test_home_contains_root_div(self, rendered_pages):
         """GET / contains root div for mounting."""
-        response = await client.get("/")
-        html = response.text
-        assert '<div id="root">' in html
+        response = rendered_pages["/"]
+        html = response.content
+        assert b'<div id="root">' in html
 
-    @pytest.mark.asyncio
-    async def test_home_contains_ssr_content(self, client):
+    async def test_home_contains_ssr_content(self, rendered_pages):
         """GET / contains server-rendered page content."""
-        response = await client.get("/")
-        html = response.text
+        response = rendered_pages["/"]
+        html = response.content
 
         # Check for content from IndexPage component
-        assert "Welcome to Pickle-Reactor" in html
-        assert "Pyodide" in html
-        assert "VDOM" in html
+        assert b"Welcome to Pickle-Reactor" in html
+        assert b"Pyodide" in html
+        assert b"VDOM" in html
 
-    @pytest.mark.asyncio
-    async def test_home_contains_bootstrap_script(self, client):
+    async def test_home_contains_bootstrap_script(self, rendered_pages):
         """GET / includes Pyodide bootstrap script."""
-        response = await client.get("/")
-        html = response.text
-        assert '/static/bootstrap.js' in html
-        assert 'type="module"' in html
+        response = rendered_pages["/"]
+        html = response.content
+        assert b'/static/bootstrap.js' in html
+        assert b'type="module"' in html
 
-    @pytest.mark.asyncio
-    async def test_home_has_meta_viewport(self, client):
+    async def test_home_has_meta_viewport(self, rendered_pages):
         """GET / includes viewport meta tag for mobile."""
-        response = await client.get("/")
-        html = response.text
-        assert '<meta name="viewport"' in html
+        response = rendered_pages["/"]
+        html = response.content
+        assert b'<meta name="viewport"' in html
 
-    @pytest.mark.asyncio
-    async def test_home_has_charset_utf8(self, client):
+    async def test_home_has_charset_utf8(self, rendered_pages):
         """GET / declares UTF-8 charset."""
-        response = await client.get("/")
-        html = response.text
-        assert '<meta charset="UTF-8">' in html
+        response = rendered_pages["/"]
+        html = response.content
+        assert b'<meta charset="UTF-8">' in html
 
 
 class TestSSRIntegration:
     """Test SSR rendering integration."""
 
-    @pytest.mark.asyncio
-    async def test_ssr_renders_component_props(self, client):
+    async def test_ssr_renders_component_props(self, rendered_pages):
         """SSR correctly renders component with props."""
-        response = await client.get("/")
-        html = response.text
+        response = rendered_pages["/"]
+        html = response.content
 
         # Check that component structure is rendered
-        assert '<div class="container">' in html
-        assert '<h1 class="title">' in html
+        assert b'<div class="container">' in html
+        assert b'<h1 class="title">' in html
 
-    @pytest.mark.asyncio
-    async def test_ssr_escapes_html(self, client):
+    async def test_ssr_escapes_html(self, rendered_pages):
         """SSR HTML-escapes content (no XSS)."""
-        response = await client.get("/")
-        html = response.text
+        response = rendered_pages["/"]
+        html = response.content
 
         # Verify no unescaped script tags
         # (Our content doesn't have scripts, but structure is escaped)
-        assert "<script>alert(" not in html
+        assert b"<script>alert(" not in html
 
-    @pytest.mark.asyncio
-    async def test_ssr_renders_nested_elements(self, client):
+    async def test_ssr_renders_nested_elements(self, rendered_pages):
         """SSR renders nested element structures."""
-        response = await client.get("/")
-        html = response.text
+        response = rendered_pages["/"]
+        html = response.content
 
         # Check nested structure from IndexPage
-        assert '<div class="features">' in html
-        assert '<p>✅' in html  # Features list items
+        assert b'<div class="features">' in html
+        assert '<p>✅'.encode() in html  # Features list items
 
-    @pytest.mark.asyncio
-    async def test_ssr_includes_status_element(self, client):
+    async def test_ssr_includes_status_element(self, rendered_pages):
         """SSR includes Pyodide status element."""
-        response = await client.get("/")
-        html = response.text
+        response = rendered_pages["/"]
+        html = response.content
 
-        assert 'id="pyodide-status"' in html
-        assert "Loading Pyodide..." in html
+        assert b'id="pyodide-status"' in html
+        assert b"Loading Pyodide..." in html
 
 
 class TestHealthEndpoint:
     """Test health check endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_health_returns_json(self, client):
-        """GET /health returns JSON with 200."""
-        response = await client.get("/health")
+    async def test_health(self, rendered_pages):
+        """GET /health returns JSON status, framework name and phase."""
+        response = rendered_pages["/health"]
         assert response.status_code == 200
         assert "application/json" in response.headers["content-type"]
-
-    @pytest.mark.asyncio
-    async def test_health_has_status_ok(self, client):
-        """GET /health returns status: ok."""
-        response = await client.get("/health")
-        data = response.json()
-        assert data["status"] == "ok"
-
-    @pytest.mark.asyncio
-    async def test_health_has_framework_name(self, client):
-        """GET /health includes framework name."""
-        response = await client.get("/health")
-        data = response.json()
-        assert data["framework"] == "pickle-reactor"
-
-    @pytest.mark.asyncio
-    async def test_health_has_phase_info(self, client):
-        """GET /health includes phase information."""
-        response = await client.get("/health")
-        data = response.json()
-        assert "phase" in data
-        assert data["phase"] == "1"
+        assert response.parsed == {
+            "status": "ok",
+            "framework": "pickle-reactor",
+            "phase": "4",
+        }
 
 
 class TestStaticFiles:
     """Test static file serving."""
 
-    @pytest.mark.asyncio
-    async def test_bootstrap_js_exists(self, client):
+    async def test_bootstrap_js_exists(self, rendered_pages):
         """GET /static/bootstrap.js returns JavaScript file."""
-        response = await client.get("/static/bootstrap.js")
+        response = rendered_pages["/static/bootstrap.js"]
         assert response.status_code == 200
 
-    @pytest.mark.asyncio
-    async def test_bootstrap_js_content_type(self, client):
+    async def test_bootstrap_js_content_type(self, rendered_pages):
         """bootstrap.js has correct content-type."""
-        response = await client.get("/static/bootstrap.js")
+        response = rendered_pages["/static/bootstrap.js"]
         # Content-type may vary, but should indicate JavaScript
         content_type = response.headers.get("content-type", "")
         assert "javascript" in content_type.lower() or "text/plain" in content_type
 
-    @pytest.mark.asyncio
-    async def test_bootstrap_js_contains_pyodide(self, client):
+    async def test_bootstrap_js_contains_pyodide(self, rendered_pages):
         """bootstrap.js contains Pyodide loading code."""
-        response = await client.get("/static/bootstrap.js")
-        js_content = response.text
-        assert "pyodide" in js_content.lower()
-        assert "loadPyodide" in js_content
+        response = rendered_pages["/static/bootstrap.js"]
+        assert "pyodide" in response.body_lower
+        assert b"loadPyodide" in response.content
 
 
 class TestResponseHeaders:
     """Test HTTP response headers."""
 
-    @pytest.mark.asyncio
-    async def test_home_content_type_html(self, client):
+    async def test_home_content_type_html(self, rendered_pages):
         """Home route returns text/html content-type."""
-        response = await client.get("/")
+        response = rendered_pages["/"]
         assert "text/html" in response.headers["content-type"]
 
-    @pytest.mark.asyncio
-    async def test_home_charset_utf8(self, client):
+    async def test_home_charset_utf8(self, rendered_pages):
         """Home route declares UTF-8 charset in headers or content."""
-        response = await client.get("/")
+        response = rendered_pages["/"]
         # Either in header or in HTML meta tag
         content_type = response.headers.get("content-type", "")
-        html = response.text
 
         assert "charset=utf-8" in content_type.lower() or \
-               'charset="UTF-8"' in html or \
-               "utf-8" in html.lower()
-
+               "utf-8" in response.body_lower
 
-class TestErrorHandling:
-    """Test error handling (404, etc.)."""
 
-    @pytest.mark.asyncio
-    async def test_404_for_unknown_route(self, client):
-        """Unknown routes return 404."""
-        response = await client.get("/nonexistent")
-        assert response.status_code == 404
+@pytest.mark.xdist_group(name="db_mutations")
+@pytest.mark.usefixtures("reset_db")
+class TestDashboardCache:
+    """Test ETag caching of the /dashboard page."""
 
-    @pytest.mark.asyncio
-    async def test_404_returns_json(self, client):
-        """404 response is JSON (FastAPI default)."""
-        response = await client.get("/nonexistent")
-        # FastAPI returns JSON 404 by default
-        assert "application/json" in response.headers.get("content-type", "")
+    async def test_dashboard_sets_etag(self, client):
+        """GET /dashboard returns HTML with an ETag header."""
+        response = await client.get("/dashboard")
+        assert response.status_code == 200
+        assert "text/html" in response.headers["content-type"]
+        assert response.headers["etag"]
+
+    async def test_dashboard_if_none_match_returns_304(self, client):
+        """Conditional GET with current ETag returns 304 Not Modified."""
+        response = await client.get("/dashboard")
+        etag = response.headers["etag"]
+
+        cached = await client.get("/dashboard", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+
+    @pytest.mark.parametrize("header", [
+        '"stale", {etag}',
+        "W/{etag}",
+        '"stale",W/{etag} , "other"',
+        "*",
+    ], ids=["list", "weak", "weak_in_list", "wildcard"])
+    async def test_dashboard_if_none_match_list_forms_return_304(self, client, header):
+        """If-None-Match lists, weak tags and * match the current ETag."""
+        response = await client.get("/dashboard")
+        etag = response.headers["etag"]
+
+        cached = await client.get("/dashboard", headers={"If-None-Match": header.format(etag=etag)})
+        assert cached.status_code == 304
+
+    async def test_dashboard_if_none_match_other_tags_return_200(self, client):
+        """If-None-Match listing only other tags returns the page."""
+        response = await client.get("/dashboard")
+
+        fresh = await client.get("/dashboard", headers={"If-None-Match": '"a", W/"b"'})
+        assert fresh.status_code == 200
+        assert fresh.headers["etag"] == response.headers["etag"]
+
+    async def test_dashboard_etag_changes_after_todo_write(self, client):
+        """Writes that change the stats produce a new ETag and fresh HTML."""
+        response = await client.get("/dashboard")
+        etag = response.headers["etag"]
+
+        await client.delete("/api/todos/1")
+
+        fresh = await client.get("/dashboard", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["etag"] != etag
+        assert '<span class="stat-number">2</span>' in fresh.text
@@ -0,0 +1,112 @@
+# ANCHOR: tests.unit.patch-helpers
+# TITLE: Mock DOM helpers for patch() unit tests
+# ROLE: tests/unit infrastructure
+# EXPORTS: MockElement, build_tree
+# SEE: tests.unit.patch
+
+"""
+Mock DOM elements and tree builders shared by the patch() unit tests.
+
+Lets tests mount VNode trees onto MockElements without Pyodide.
+"""
+
+
+class MockElement:
+    """Mock DOM element for unit testing.
+
+    Simulates DOM element behavior without requiring browser/Pyodide.
+    Tracks all operations for assertion in tests.
+    """
+    __slots__ = ("tag", "textContent", "className", "_style", "_attributes",
+                 "children", "event_listeners", "parent")
+
+    def __init__(self, tag):
+        self.tag = tag
+        self.textContent = ""
+        self.className = ""
+        # style/attributes dicts are allocated on first access; most
+        # elements in these tests never touch either
+        self._style = None
+        self._attributes = None
+        self.children = []
+        self.event_listeners = {}
+        self.parent = None
+
+    @property
+    def childNodes(self):
+        """Property to access children (DOM API compatibility)."""
+        return self.children
+
+    @property
+    def style(self):
+        """Inline style dict, created on first access."""
+        if self._style is None:
+            self._style = {}
+        return self._style
+
+    @property
+    def attributes(self):
+        """Attribute dict, created on first access."""
+        if self._attributes is None:
+            self._attributes = {}
+        return self._attributes
+
+    def setAttribute(self, key, value):
+        self.attributes[key] = value
+
+    def removeAttribute(self, key):
+        if self._attributes and key in self._attributes:
+            del self._attributes[key]
+
+    def addEventListener(self, event, handler):
+        if event not in self.event_listeners:
+            self.event_listeners[event] = []
+        self.event_listeners[event].append(handler)
+
+    def removeEventListener(self, event, handler):
+        if event in self.event_listeners:
+            self.event_listeners[event].remove(handler)
+
+    def appendChild(self, child):
+        self.children.append(child)
+        if hasattr(child, 'parent'):
+            child.parent = self
+
+    def removeChild(self, child):
+        # One identity scan instead of `in` followed by list.remove()
+        for i, c in enumerate(self.children):
+            if c is child:
+                del self.children[i]
+                child.parent = None
+                return
+
+    def insertBefore(self, new_child, ref_child):
+        for i, c in enumerate(self.children):
+            if c is ref_child:
+                self.children.insert(i, new_child)
+                new_child.parent = self
+                return
+        self.appendChild(new_child)
+
+    def remove(self):
+        if self.parent:
+            self.parent.removeChild(self)
+
+
+def build_tree(vnode):
+    """Mount a VNode tree onto fresh MockElements.
+
+    Text children are left to the parent element, as in the DOM tests.
+
+    Args:
+        vnode: VNode to mount; its _el and its descendants' _el are set
+
+    Returns:
+        MockElement for vnode
+    """
+    el = MockElement(vnode.tag)
+    for child in vnode.children:
+        if not isinstance(child, str):
+            el.appendChild(build_tree(child))
+    vnode._el = el
+    return el
@@ -20,112 +20,105 @@ TESTING STRATEGY:
 - Test all edge cases: add, remove, replace, move, update
 """
 
+from types import SimpleNamespace
+
 import pytest
 from shared.vdom import VNode, h, div, button, span, ul, li
-from unittest.mock import Mock, MagicMock, call
+from tests.unit._patch_helpers import MockElement, build_tree
 
 
 # ANCHOR: tests.unit.patch.fixtures
-# Mock DOM element for testing without Pyodide
+# Mock DOM element for testing without Pyodide (see tests.unit.patch-helpers)
+
+def attach_keyed(vnodes, parent):
+    """Mount keyed VNodes under parent, one new <li> MockElement each."""
+    for vnode in vnodes:
+        vnode._el = MockElement("li")
+        parent.appendChild(vnode._el)
 
-class MockElement:
-    """Mock DOM element for unit testing.
 
-    Simulates DOM element behavior without requiring browser/Pyodide.
-    Tracks all operations for assertion in tests.
+class _FakeDoc:
+    """Stand-in for js.document that records node creation.
+
+    WHY: unittest.mock's call recording and attribute proxying cost more than
+    the patch logic under test; plain bound methods appending to lists
+    cover everything the tests assert on
     """
-    def __init__(self, tag):
-        self.tag = tag
-        self.textContent = ""
-        self.className = ""
-        self.style = {}
-        self.attributes = {}
-        self.children = []
-        self.event_listeners = {}
-        self.parent = None
-
-    @property
-    def childNodes(self):
-        """Property to access children (DOM API compatibility)."""
-        return self.children
-
-    def setAttribute(self, key, value):
-        self.attributes[key] = value
-
-    def removeAttribute(self, key):
-        if key in self.attributes:
-            del self.attributes[key]
-
-    def addEventListener(self, event, handler):
-        if event not in self.event_listeners:
-            self.event_listeners[event] = []
-        self.event_listeners[event].append(handler)
-
-    def removeEventListener(self, event, handler):
-        if event in self.event_listeners:
-            self.event_listeners[event].remove(handler)
-
-    def appendChild(self, child):
-        self.children.append(child)
-        if hasattr(child, 'parent'):
-            child.parent = self
-
-    def removeChild(self, child):
-        if child in self.children:
-            self.children.remove(child)
-            if hasattr(child, 'parent'):
-                child.parent = None
-
-    def insertBefore(self, new_child, ref_child):
-        if ref_child in self.children:
-            idx = self.children.index(ref_child)
-            self.children.insert(idx, new_child)
-            if hasattr(new_child, 'parent'):
-                new_child.parent = self
-        else:
-            self.appendChild(new_child)
-
-    def remove(self):
-        if self.parent:
-            self.parent.removeChild(self)
+    __slots__ = ("createElement", "createTextNode", "create_el_calls", "create_text_calls")
 
+    def __init__(self):
+        self.createElement = self._create_element
+        self.createTextNode = self._create_text_node
+        self.create_el_calls = []
+        self.create_text_calls = []
 
-@pytest.fixture
-def mock_document(monkeypatch):
-    """Mock js.document for unit testing without Pyodide."""
-    def createElement(tag):
+    def _create_element(self, tag):
+        self.create_el_calls.append(tag)
         return MockElement(tag)
 
-    def createTextNode(text):
+    def _create_text_node(self, text):
+        self.create_text_calls.append(text)
         node = MockElement("text")
         node.textContent = text
         return node
 
-    mock_doc = Mock()
-    mock_doc.createElement = Mock(side_effect=createElement)
-    mock_doc.createTextNode = Mock(side_effect=createTextNode)
+
+# client.runtime patch functions, bound by _mock_document_session once js
+# is mocked
+_PATCH = None
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _mock_document_session():
+    """Install js/pyodide mocks and import client.runtime once per module.
+
+    WHY: Building the mocks, rewriting sys.modules and resolving the
+    runtime import per test is pure setup overhead; every patch test can
+    share one installation and call the functions bound on _PATCH
+
+    SEE: mock_document (per-test reset of call tracking)
+    """
+    global _PATCH
+    mock_doc = _FakeDoc()
 
     # Mock js module
     import sys
-    mock_js = Mock()
-    mock_js.document = mock_doc
+    mock_js = SimpleNamespace(document=mock_doc)
     sys.modules['js'] = mock_js
 
     # Mock pyodide.ffi
-    mock_pyodide = Mock()
-    mock_ffi = Mock()
-    mock_ffi.create_proxy = Mock(side_effect=lambda f: f)  # Return function as-is
-    mock_pyodide.ffi = mock_ffi
+    mock_ffi = SimpleNamespace(create_proxy=lambda f: f)  # Return function as-is
+    mock_pyodide = SimpleNamespace(ffi=mock_ffi)
     sys.modules['pyodide'] = mock_pyodide
     sys.modules['pyodide.ffi'] = mock_ffi
 
+    import client.runtime as _rt
+    _PATCH = SimpleNamespace(
+        mount=_rt.mount,
+        patch=_rt.patch,
+        patch_props=_rt.patch_props,
+        patch_children=_rt.patch_children,
+        patch_keyed_children=_rt.patch_keyed_children,
+    )
+
     yield mock_doc
 
     # Cleanup
-    if 'js' in sys.modules:
-        del sys.modules['js']
-    if 'pyodide' in sys.modules:
-        del sys.modules['pyodide']
+    _PATCH = None
+    for name in ('js', 'pyodide', 'pyodide.ffi'):
+        sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def mock_document(_mock_document_session):
+    """Mock js.document for unit testing without Pyodide.
+
+    Shares the module-wide fake; only the call lists are cleared so
+    per-test count assertions still hold.
+    """
+    _mock_document_session.create_el_calls.clear()
+    _mock_document_session.create_text_calls.clear()
+    return _mock_document_session
 
 
 # ANCHOR: tests.unit.patch.text-nodes
@@ -133,8 +126,6 @@ def mock_document(monkeypatch):
 
 def test_patch_text_node_same_content(mock_document):
     """patch() should not update DOM when text content unchanged."""
-    from client.runtime import patch
-
     parent = MockElement("div")
 
     # Create text nodes with same content
@@ -143,19 +134,17 @@ def test_patch_text_node_same_content(mock_document):
 
     # First mount to create _el reference
     old_el = mock_document.createTextNode(old_text)
-    old_text_obj = Mock(_el=old_el)
+    old_text_obj = SimpleNamespace(_el=old_el)
     new_text_obj = "Hello"
 
-    patch(parent, old_text, new_text)
+    _PATCH.patch(parent, old_text, new_text)
 
     # Should not create new text node
-    assert mock_document.createTextNode.call_count == 1  # Only from fixture setup
+    assert len(mock_document.create_text_calls) == 1  # Only from fixture setup
 
 
 def test_patch_text_node_different_content(mock_document):
     """patch() should update textContent when text differs."""
-    from client.runtime import patch
-
     parent = MockElement("div")
 
     old_text = "Hello"
@@ -164,37 +153,33 @@ def test_patch_text_node_different_content(mock_document):
     # Create old text node with _el
     old_el = mock_document.createTextNode(old_text)
 
-    patch(parent, old_text, new_text)
+    _PATCH.patch(parent, old_text, new_text)
 
     # Should update textContent in-place (when we implement it)
     # For now, this test documents expected behavior
 
 
-def test_patch_text_to_element(mock_document):
+def test_patch_text_to_element():
     """patch() should replace text node with element."""
-    from client.runtime import patch
-
     parent = MockElement("div")
 
     old_vnode = "Hello"
     new_vnode = div({}, "World")
 
-    patch(parent, old_vnode, new_vnode)
+    _PATCH.patch(parent, old_vnode, new_vnode)
 
     # Should create new element and remove old text
     # For now, this test documents expected behavior
 
 
-def test_patch_element_to_text(mock_document):
+def test_patch_element_to_text():
     """patch() should replace element with text node."""
-    from client.runtime import patch
-
     parent = MockElement("div")
 
     old_vnode = div({}, "Hello")
     new_vnode = "World"
 
-    patch(parent, old_vnode, new_vnode)
+    _PATCH.patch(parent, old_vnode, new_vnode)
 
     # Should remove element and create text node
     # For now, this test documents expected behavior
@@ -203,10 +188,8 @@ def test_patch_element_to_text(mock_document):
 # ANCHOR: tests.unit.patch.element-type
 # Test patch() with different element types
 
-def test_patch_same_tag_reuses_element(mock_document):
+def test_patch_same_tag_reuses_element():
     """patch() should reuse DOM element when tags match."""
-    from client.runtime import patch
-
     parent = MockElement("div")
 
     old_vnode = div({"class": "old"}, "Old")
@@ -216,16 +199,63 @@ def test_patch_same_tag_reuses_element(mock_document):
     old_el = MockElement("div")
     old_vnode._el = old_el
 
-    patch(parent, old_vnode, new_vnode)
+    _PATCH.patch(parent, old_vnode, new_vnode)
 
     # Should reuse same element reference
     assert new_vnode._el is old_el
 
 
-def test_patch_different_tag_replaces_element(mock_document):
-    """patch() should replace element when tags differ."""
-    from client.runtime import patch
+def test_patch_equal_subtree_adopts_elements(mock_document):
+    """patch() hands DOM references to an equal subtree without diffing."""
+    parent = MockElement("div")
 
+    old_vnode = div({"class": "card"}, span({}, "A"), "text", span({}, "B"))
+    new_vnode = div({"class": "card"}, span({}, "A"), "text", span({}, "B"))
+
+    build_tree(old_vnode)
+
+    _PATCH.patch(parent, old_vnode, new_vnode)
+
+    assert new_vnode._el is old_vnode._el
+    assert new_vnode.children[0]._el is old_vnode.children[0]._el
+    assert new_vnode.children[2]._el is old_vnode.children[2]._el
+    assert mock_document.create_el_calls == []
+
+
+@pytest.mark.parametrize("old_props,new_props,attr,expected", [
+    ({"value": -1}, {"value": -2}, "value", "-2"),
+    ({"style": {"color": "red"}}, {"style": "{'color': 'red'}"},
+     "style", "{'color': 'red'}"),
+], ids=["int_hash_collision", "repr_hash_collision"])
+def test_patch_colliding_hashes_still_patch(old_props, new_props, attr, expected):
+    """patch() does not treat equal static hashes as equal subtrees."""
+    parent = MockElement("div")
+    old_vnode = VNode("input", old_props)
+    new_vnode = VNode("input", new_props)
+    assert old_vnode.static_hash() == new_vnode.static_hash()
+
+    old_vnode._el = MockElement("input")
+    _PATCH.patch(parent, old_vnode, new_vnode)
+
+    assert new_vnode._el is old_vnode._el
+    assert new_vnode._el.attributes[attr] == expected
+
+
+def test_patch_colliding_props_with_changed_children_patch_props():
+    """patch_props runs when props hashes collide but values differ."""
+    parent = MockElement("div")
+    old_vnode = div({"tabindex": -1}, "old")
+    new_vnode = div({"tabindex": -2}, "new")
+    assert old_vnode.props_hash() == new_vnode.props_hash()
+
+    old_vnode._el = MockElement("div")
+    _PATCH.patch(parent, old_vnode, new_vnode)
+
+    assert new_vnode._el.attributes["tabindex"] == "-2"
+
+
+def test_patch_different_tag_replaces_element():
+    """patch() should replace element when tags differ."""
     parent = MockElement("div")
 
     old_vnode = div({}, "Content")
@@ -236,7 +266,7 @@ def test_patch_different_tag_replaces_element(mock_document):
     old_vnode._el = old_el
     parent.appendChild(old_el)
 
-    patch(parent, old_vnode, new_vnode)
+    _PATCH.patch(parent, old_vnode, new_vnode)
 
     # Should create new element with different tag
     # Old element should be removed
@@ -246,27 +276,23 @@ def test_patch_different_tag_replaces_element(mock_document):
 # ANCHOR: tests.unit.patch.props
 # Test patch_props() functionality
 
-def test_patch_props_updates_attributes(mock_document):
+def test_patch_props_updates_attributes():
     """patch_props() should update changed attributes."""
-    from client.runtime import patch_props
-
     element = MockElement("div")
     element.className = "container"  # Set initial className
 
     old_props = {"id": "old", "class": "container"}
     new_props = {"id": "new", "class": "container"}
 
-    patch_props(element, old_props, new_props)
+    _PATCH.patch_props(element, old_props, new_props)
 
     # Should update id but not class (class unchanged, skipped)
     assert element.attributes.get("id") == "new"
     assert element.className == "container"
 
 
-def test_patch_props_removes_old_attributes(mock_document):
+def test_patch_props_removes_old_attributes():
     """patch_props() should remove attributes not in new props."""
-    from client.runtime import patch_props
-
     element = MockElement("div")
     element.setAttribute("old-attr", "value")
     element.setAttribute("keep", "this")  # Set initial value
@@ -274,32 +300,28 @@ def test_patch_props_removes_old_attributes(mock_document):
     old_props = {"old-attr": "value", "keep": "this"}
     new_props = {"keep": "this"}
 
-    patch_props(element, old_props, new_props)
+    _PATCH.patch_props(element, old_props, new_props)
 
     # Should remove old-attr
     assert "old-attr" not in element.attributes
     assert element.attributes.get("keep") == "this"
 
 
-def test_patch_props_adds_new_attributes(mock_document):
+def test_patch_props_adds_new_attributes():
     """patch_props() should add new attributes."""
-    from client.runtime import patch_props
-
     element = MockElement("div")
 
     old_props = {"class": "old"}
     new_props = {"class": "old", "id": "new-id"}
 
-    patch_props(element, old_props, new_props)
+    _PATCH.patch_props(element, old_props, new_props)
 
     # Should add id attribute
     assert element.attributes.get("id") == "new-id"
 
 
-def test_patch_props_updates_event_handlers(mock_document):
+def test_patch_props_updates_event_handlers():
     """patch_props() should update event handlers."""
-    from client.runtime import patch_props
-
     element = MockElement("div")
 
     old_handler = lambda e: print("old")
@@ -311,17 +333,15 @@ def test_patch_props_updates_event_handlers(mock_document):
     # First add old handler
     element.addEventListener("click", old_handler)
 
-    patch_props(element, old_props, new_props)
+    _PATCH.patch_props(element, old_props, new_props)
 
     # Should have new handler
     # Implementation may vary: replace or add new
     # For now, this test documents expected behavior
 
 
-def test_patch_props_removes_event_handlers(mock_document):
+def test_patch_props_removes_event_handlers():
     """patch_props() should remove event handlers not in new props."""
-    from client.runtime import patch_props
-
     element = MockElement("div")
 
     old_handler = lambda e: print("old")
@@ -330,22 +350,20 @@ def test_patch_props_removes_event_handlers(mock_document):
 
     element.addEventListener("click", old_handler)
 
-    patch_props(element, old_props, new_props)
+    _PATCH.patch_props(element, old_props, new_props)
 
     # Should remove click handler
     # For now, this test documents expected behavior
 
 
-def test_patch_props_updates_style_dict(mock_document):
+def test_patch_props_updates_style_dict():
     """patch_props() should update inline styles."""
-    from client.runtime import patch_props
-
     element = MockElement("div")
 
     old_props = {"style": {"color": "red", "fontSize": "12px"}}
     new_props = {"style": {"color": "blue", "fontSize": "12px", "fontWeight": "bold"}}
 
-    patch_props(element, old_props, new_props)
+    _PATCH.patch_props(element, old_props, new_props)
 
     # Should update color, keep fontSize, add fontWeight
     assert element.style.get("color") == "blue"
@@ -356,10 +374,8 @@ def test_patch_props_updates_style_dict(mock_document):
 # ANCHOR: tests.unit.patch.children
 # Test patch_children() for non-keyed children
 
-def test_patch_children_same_count(mock_document):
+def test_patch_children_same_count():
     """patch_children() should patch children at same index."""
-    from client.runtime import patch_children
-
     parent = MockElement("div")
 
     old_children = [
@@ -372,21 +388,17 @@ def test_patch_children_same_count(mock_document):
     ]
 
     # Set up old elements
-    for i, child in enumerate(old_children):
-        el = MockElement("span")
-        child._el = el
-        parent.appendChild(el)
+    for child in old_children:
+        parent.appendChild(build_tree(child))
 
-    patch_children(parent, old_children, new_children)
+    _PATCH.patch_children(parent, old_children, new_children)
 
     # Should patch both children in place
     # For now, this test documents expected behavior
 
 
-def test_patch_children_add_new(mock_document):
+def test_patch_children_add_new():
     """patch_children() should add new children at end."""
-    from client.runtime import patch_children
-
     parent = MockElement("div")
 
     old_children = [span({}, "Child 1")]
@@ -397,19 +409,16 @@ def test_patch_children_add_new(mock_document):
     ]
 
     # Set up old element
-    old_children[0]._el = MockElement("span")
-    parent.appendChild(old_children[0]._el)
+    parent.appendChild(build_tree(old_children[0]))
 
-    patch_children(parent, old_children, new_children)
+    _PATCH.patch_children(parent, old_children, new_children)
 
     # Should add 2 new children
     # For now, this test documents expected behavior
 
 
-def test_patch_children_remove_old(mock_document):
+def test_patch_children_remove_old():
     """patch_children() should remove extra old children."""
-    from client.runtime import patch_children
-
     parent = MockElement("div")
 
     old_children = [
@@ -421,11 +430,9 @@ def test_patch_children_remove_old(mock_document):
 
     # Set up old elements
     for child in old_children:
-        el = MockElement("span")
-        child._el = el
-        parent.appendChild(el)
+        parent.appendChild(build_tree(child))
 
-    patch_children(parent, old_children, new_children)
+    _PATCH.patch_children(parent, old_children, new_children)
 
     # Should remove 2 children
     # For now, this test documents expected behavior
@@ -434,18 +441,18 @@ def test_patch_children_remove_old(mock_document):
 # ANCHOR: tests.unit.patch.keyed-children
 # Test patch_keyed_children() for list optimization
 
-def test_patch_keyed_children_reorders_by_key(mock_document):
-    """patch_keyed_children() should reorder children by key."""
-    from client.runtime import patch_keyed_children
-
+@pytest.fixture
+def parent_with_abc():
+    """Parent <div> with keyed <li> children A, B, C already mounted."""
     parent = MockElement("div")
+    children = [li({"key": k}, f"Item {k.upper()}") for k in ("a", "b", "c")]
+    attach_keyed(children, parent)
+    return parent, children
 
-    # Old: A, B, C
-    old_children = [
-        li({"key": "a"}, "Item A"),
-        li({"key": "b"}, "Item B"),
-        li({"key": "c"}, "Item C")
-    ]
+
+def test_patch_keyed_children_reorders_by_key(parent_with_abc):
+    """patch_keyed_children() should reorder children by key."""
+    parent, old_children = parent_with_abc
 
     # New: C, A, B (reordered)
     new_children = [
@@ -454,100 +461,56 @@ def test_patch_keyed_children_reorders_by_key(mock_document):
         li({"key": "b"}, "Item B")
     ]
 
-    # Set up old elements
-    for i, child in enumerate(old_children):
-        el = MockElement("li")
-        child._el = el
-        parent.appendChild(el)
-
-    patch_keyed_children(parent, old_children, new_children)
+    _PATCH.patch_keyed_children(parent, old_children, new_children)
 
     # Should reorder DOM elements to match new order
     # Minimal DOM moves (ideally 1-2 operations)
     # For now, this test documents expected behavior
 
 
-def test_patch_keyed_children_adds_new_items(mock_document):
+def test_patch_keyed_children_adds_new_items(parent_with_abc):
     """patch_keyed_children() should add new keyed items."""
-    from client.runtime import patch_keyed_children
-
-    parent = MockElement("div")
-
-    old_children = [
-        li({"key": "a"}, "Item A"),
-        li({"key": "b"}, "Item B")
-    ]
+    parent, old_children = parent_with_abc
 
     new_children = [
         li({"key": "a"}, "Item A"),
         li({"key": "b"}, "Item B"),
-        li({"key": "c"}, "Item C")  # New item
+        li({"key": "c"}, "Item C"),
+        li({"key": "d"}, "Item D")  # New item
     ]
 
-    # Set up old elements
-    for child in old_children:
-        el = MockElement("li")
-        child._el = el
-        parent.appendChild(el)
-
-    patch_keyed_children(parent, old_children, new_children)
+    _PATCH.patch_keyed_children(parent, old_children, new_children)
 
     # Should add new item
     # For now, this test documents expected behavior
 
 
-def test_patch_keyed_children_removes_old_items(mock_document):
+def test_patch_keyed_children_removes_old_items(parent_with_abc):
     """patch_keyed_children() should remove old keyed items."""
-    from client.runtime import patch_keyed_children
-
-    parent = MockElement("div")
-
-    old_children = [
-        li({"key": "a"}, "Item A"),
-        li({"key": "b"}, "Item B"),
-        li({"key": "c"}, "Item C")
-    ]
+    parent, old_children = parent_with_abc
 
     new_children = [
         li({"key": "a"}, "Item A")
         # B and C removed
     ]
 
-    # Set up old elements
-    for child in old_children:
-        el = MockElement("li")
-        child._el = el
-        parent.appendChild(el)
-
-    patch_keyed_children(parent, old_children, new_children)
+    _PATCH.patch_keyed_children(parent, old_children, new_children)
 
     # Should remove B and C
     # For now, this test documents expected behavior
 
 
-def test_patch_keyed_children_updates_existing_items(mock_document):
+def test_patch_keyed_children_updates_existing_items(parent_with_abc):
     """patch_keyed_children() should update content of existing items."""
-    from client.runtime import patch_keyed_children
-
-    parent = MockElement("div")
-
-    old_children = [
-        li({"key": "a"}, "Item A"),
-        li({"key": "b"}, "Item B")
-    ]
+    parent, old_children = parent_with_abc
 
     new_children = [
         li({"key": "a"}, "Updated A"),  # Content changed
-        li({"key": "b"}, "Updated B")   # Content changed
+        li({"key": "b"}, "Updated B"),  # Content changed
+        li({"key": "c"}, "Updated C")   # Content changed
     ]
 
-    # Set up old elements
-    for child in old_children:
-        el = MockElement("li")
-        child._el = el
-        parent.appendChild(el)
-
-    patch_keyed_children(parent, old_children, new_children)
+    _PATCH.patch_keyed_children(parent, old_children, new_children)
 
     # Should patch content without recreating elements
     # For now, this test documents expected behavior
@@ -556,25 +519,21 @@ def test_patch_keyed_children_updates_existing_items(mock_document):
 # ANCHOR: tests.unit.patch.edge-cases
 # Test edge cases
 
-def test_patch_none_to_element(mock_document):
+def test_patch_none_to_element():
     """patch() should mount element when old is None."""
-    from client.runtime import patch
-
     parent = MockElement("div")
 
     old_vnode = None
     new_vnode = div({}, "New")
 
-    patch(parent, old_vnode, new_vnode)
+    _PATCH.patch(parent, old_vnode, new_vnode)
 
     # Should mount new element
     # For now, this test documents expected behavior
 
 
-def test_patch_element_to_none(mock_document):
+def test_patch_element_to_none():
     """patch() should remove element when new is None."""
-    from client.runtime import patch
-
     parent = MockElement("div")
 
     old_vnode = div({}, "Old")
@@ -585,16 +544,14 @@ def test_patch_element_to_none(mock_document):
     old_vnode._el = old_el
     parent.appendChild(old_el)
 
-    patch(parent, old_vnode, new_vnode)
+    _PATCH.patch(parent, old_vnode, new_vnode)
 
     # Should remove element
     # For now, this test documents expected behavior
 
 
-def test_patch_empty_children_lists(mock_document):
+def test_patch_empty_children_lists():
     """patch() should handle empty children lists."""
-    from client.runtime import patch
-
     parent = MockElement("div")
 
     old_vnode = div({})  # No children
@@ -603,19 +560,16 @@ def test_patch_empty_children_lists(mock_document):
     old_el = MockElement("div")
     old_vnode._el = old_el
 
-    patch(parent, old_vnode, new_vnode)
+    _PATCH.patch(parent, old_vnode, new_vnode)
 
     # Should reuse element with no children
     assert new_vnode._el is old_el
 
 
-def test_patch_deeply_nested_structures(mock_document):
-    """patch() should handle deeply nested VDOM trees."""
-    from client.runtime import patch
-
-    parent = MockElement("div")
-
-    old_vnode = div({},
+@pytest.fixture(scope="module")
+def deep_old_vnode():
+    """Four-level div/div/div/span tree with MockElements attached."""
+    vnode = div({},
         div({},
             div({},
                 span({}, "Deep")
@@ -623,6 +577,14 @@ def test_patch_deeply_nested_structures(mock_document):
         )
     )
 
+    build_tree(vnode)
+    return vnode
+
+
+def test_patch_deeply_nested_structures(deep_old_vnode):
+    """patch() should handle deeply nested VDOM trees."""
+    parent = MockElement("div")
+
     new_vnode = div({},
         div({},
             div({},
@@ -631,17 +593,75 @@ def test_patch_deeply_nested_structures(mock_document):
         )
     )
 
-    # Set up old elements recursively
-    def setup_elements(vnode):
-        if isinstance(vnode, str):
-            return
-        vnode._el = MockElement(vnode.tag)
-        for child in vnode.children:
-            setup_elements(child)
-
-    setup_elements(old_vnode)
-
-    patch(parent, old_vnode, new_vnode)
+    _PATCH.patch(parent, deep_old_vnode, new_vnode)
 
     # Should patch nested content efficiently
     # For now, this test documents expected behavior
+
+
+# ANCHOR: tests.unit.patch.shared-nodes
+# VNodes reused across renders (hoisted constants, memo caches) that change
+# position between the old and new tree
+
+def _child_classes(el):
+    """className of each element child of el, skipping text nodes."""
+    return [c.className for c in el.children if c.tag != "text"]
+
+
+def test_patch_dashboard_error_toggle_keeps_shared_sections(mock_document):
+    """Hoisted dashboard sections survive the error banner shifting them."""
+    from pages.dashboard import DashboardPage
+    from shared.state import ComponentInstance, render_component
+
+    root = MockElement("div")
+    inst = ComponentInstance()
+    vdom = _PATCH.mount(root, render_component(DashboardPage, {}, inst))
+
+    for error in ("boom", None, "boom"):
+        inst.state[2] = error
+        vdom = _PATCH.patch(root, vdom, render_component(DashboardPage, {}, inst))
+
+    assert _child_classes(root.children[0])[-3:] == ["status", "section", "page-nav"]
+
+    inst.state[2] = None
+    vdom = _PATCH.patch(root, vdom, render_component(DashboardPage, {}, inst))
+    assert _child_classes(root.children[0])[-3:] == ["todo-actions", "section", "page-nav"]
+
+
+def test_patch_memo_node_rows_shifting_positions(mock_document):
+    """Cached rows that move index keep the DOM in step with the VDOM."""
+    from shared.vdom import memo_node
+
+    row = memo_node(lambda i: li({"key": f"item-{i}"}, f"Item {i}"))
+    root = MockElement("div")
+    vdom = _PATCH.mount(root, ul({}, row(0), row(1), row(2)))
+
+    for items in ([1, 2], [0, 1, 2], [2], [0, 1, 2]):
+        vdom = _PATCH.patch(root, vdom, ul({}, *[row(i) for i in items]))
+        texts = [el.children[0].textContent for el in root.children[0].children]
+        assert texts == [f"Item {i}" for i in items]
+
+
+def test_patch_memo_component_shifted_by_conditional_sibling(mock_document):
+    """A memo() hit that moves index does not corrupt the DOM."""
+    from shared.state import ComponentInstance, memo, render_component, use_state
+
+    @memo
+    def Badge(props):
+        return span({"class": "badge"}, props["label"])
+
+    def Page(props):
+        notice, _ = use_state(False)
+        children = [div({"class": "notice"}, "Notice")] if notice else []
+        children += [Badge({"label": "new"}), div({"class": "footer"}, "End")]
+        return div({}, *children)
+
+    root = MockElement("div")
+    inst = ComponentInstance()
+    vdom = _PATCH.mount(root, render_component(Page, {}, inst))
+
+    for notice in (True, False, True, False):
+        inst.state[0] = notice
+        vdom = _PATCH.patch(root, vdom, render_component(Page, {}, inst))
+        expected = ["badge", "footer"]
+        assert _child_classes(root.children[0]) == (["notice"] + expected if notice else expected)
@@ -20,6 +20,10 @@ from pages.index import IndexPage
 from pages.about import AboutPage
 from pages.todos import TodosPage
 
+# Snapshot of the registry, built once for iteration-heavy tests
+_ROUTE_ITEMS = tuple(ROUTES.items())
+_ROUTE_PATHS = tuple(ROUTES.keys())
+
 
 class TestRoutingRegistry:
     """Test the routing registry structure and contents."""
@@ -44,22 +48,15 @@ class TestRoutingRegistry:
         """Todos route (/todos) exists in ROUTES."""
         assert "/todos" in ROUTES
 
-    def test_route_values_are_tuples(self):
-        """Each route value is a (component, component_name) tuple."""
-        for path, value in ROUTES.items():
-            assert isinstance(value, tuple), f"Route {path} value is not a tuple"
-            assert len(value) == 2, f"Route {path} tuple does not have 2 elements"
-
-    def test_route_components_are_callable(self):
-        """Each route component is callable."""
-        for path, (component, component_name) in ROUTES.items():
-            assert callable(component), f"Route {path} component is not callable"
-
-    def test_route_component_names_are_strings(self):
-        """Each route component name is a string."""
-        for path, (component, component_name) in ROUTES.items():
-            assert isinstance(component_name, str), f"Route {path} component name is not a string"
-            assert len(component_name) > 0, f"Route {path} component name is empty"
+    @pytest.mark.parametrize("path,value", _ROUTE_ITEMS, ids=_ROUTE_PATHS)
+    def test_route_entry_well_formed(self, path, value):
+        """Each route value is a (callable component, non-empty name) tuple."""
+        assert isinstance(value, tuple), f"Route {path} value is not a tuple"
+        assert len(value) == 2, f"Route {path} tuple does not have 2 elements"
+        component, component_name = value
+        assert callable(component), f"Route {path} component is not callable"
+        assert isinstance(component_name, str), f"Route {path} component name is not a string"
+        assert len(component_name) > 0, f"Route {path} component name is empty"
 
 
 class TestRouteMapping:
@@ -174,10 +171,10 @@ class TestRoutingEdgeCases:
 
     def test_all_component_names_unique(self):
         """All component names in ROUTES are unique."""
-        component_names = [name for _, name in ROUTES.values()]
+        component_names = [name for _, (_, name) in _ROUTE_ITEMS]
         assert len(component_names) == len(set(component_names))
 
     def test_all_routes_start_with_slash(self):
         """All route paths start with /."""
-        for path in ROUTES.keys():
+        for path in _ROUTE_PATHS:
             assert path.startswith("/"), f"Route {path} does not start with /"
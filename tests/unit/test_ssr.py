@@ -17,9 +17,13 @@ Tests cover:
 - Security: XSS prevention with malicious inputs
 """
 
+import io
+import sys
+from pathlib import Path
+
 import pytest
 from shared.vdom import VNode, h, div, button, span, h1, p, input_field, img, br
-from server.ssr import render_to_string
+from server.ssr import render_to_bytes, render_to_stream, render_to_string
 
 
 class TestBasicRendering:
@@ -101,6 +105,18 @@ class TestPropsRendering:
         html = render_to_string(node)
         assert html == '<div tabindex="0">Content</div>'
 
+    def test_render_float_and_object_attributes(self):
+        """render_to_string stringifies floats and escapes other values."""
+        node = div({"data-ratio": 0.5, "data-path": Path("a&b")})
+        html = render_to_string(node)
+        assert html == '<div data-ratio="0.5" data-path="a&amp;b"></div>'
+
+    def test_render_style_dict(self):
+        """render_to_string serializes style dicts to CSS text."""
+        node = div({"style": {"fontSize": "12px", "color": "red", "margin-top": 0}})
+        html = render_to_string(node)
+        assert html == '<div style="font-size:12px;color:red;margin-top:0"></div>'
+
 
 class TestChildrenRendering:
     """Test children rendering."""
@@ -130,6 +146,15 @@ class TestChildrenRendering:
         html = render_to_string(node)
         assert html == "<div><h1><span>Title</span></h1></div>"
 
+    def test_render_beyond_recursion_limit(self):
+        """render_to_string does not recurse per nesting level."""
+        depth = sys.getrecursionlimit() + 100
+        node = "leaf"
+        for _ in range(depth):
+            node = div({}, node)
+        html = render_to_string(node)
+        assert html == "<div>" * depth + "leaf" + "</div>" * depth
+
     def test_render_mixed_children(self):
         """render_to_string renders mix of text and VNodes."""
         child_vnode = span({}, "highlighted")
@@ -182,6 +207,21 @@ class TestHTMLEscaping:
         assert "<script>" not in html
         assert "&lt;script&gt;" in html
 
+    def test_escape_matches_html_escape(self):
+        """_escape produces the same entities as html.escape(quote=True)."""
+        from html import escape
+        from server.ssr import _escape
+
+        for text in ("", "plain", "&amp;", "<a href=\"x\">it's</a> & more"):
+            assert _escape(text) == escape(text)
+
+    def test_escape_returns_clean_text_unchanged(self):
+        """_escape returns the same object when nothing needs escaping."""
+        from server.ssr import _escape
+
+        text = "Hello, world ✅"
+        assert _escape(text) is text
+
 
 class TestEventHandlers:
     """Test event handler props (should be ignored on server)."""
@@ -241,6 +281,16 @@ class TestSelfClosingTags:
         html = render_to_string(node)
         assert "<br" in html
 
+    def test_void_tags_have_no_closing_tag(self):
+        """render_to_string emits void elements without a closing tag."""
+        html = render_to_string(div({}, br(), img({"src": "/a.png"})))
+        assert html == '<div><br><img src="/a.png"></div>'
+
+    def test_void_tag_with_children_raises(self):
+        """render_to_string rejects children on a void element."""
+        with pytest.raises(ValueError, match="<br>"):
+            render_to_string(div({}, h("br", {}, "text")))
+
 
 class TestComplexStructures:
     """Test complex nested structures."""
@@ -298,6 +348,23 @@ class TestComplexStructures:
         assert '<div class="inner">Content</div>' in html
 
 
+class TestStreamRendering:
+    """Test render_to_stream and render_to_bytes output."""
+
+    def test_stream_matches_string(self):
+        """render_to_stream writes the same HTML as render_to_string."""
+        node = div({"class": "a<b", "on_click": print},
+                   h1({}, "Title & more"), br(), p({}, "x"))
+        buf = io.StringIO()
+        render_to_stream(node, buf.write)
+        assert buf.getvalue() == render_to_string(node)
+
+    def test_bytes_are_utf8_of_string(self):
+        """render_to_bytes returns the UTF-8 encoding of the HTML."""
+        node = p({"title": "<é>"}, "Hello 世界 & 🌍")
+        assert render_to_bytes(node) == render_to_string(node).encode("utf-8")
+
+
 class TestSecurityXSSPrevention:
     """Test XSS prevention with malicious inputs."""
 
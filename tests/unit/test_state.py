@@ -1,7 +1,7 @@
 # ANCHOR: tests.unit.state
 # TITLE: Unit tests for state management (ComponentInstance, use_state, render_component)
 # ROLE: tests/unit layer
-# COVERS: shared.state.ComponentInstance, shared.state.use_state, shared.state.render_component
+# COVERS: shared.state.ComponentInstance, shared.state.use_state, shared.state.render_component, shared.state.batch
 # SCENARIOS: State initialization, set_value updates, multiple hooks, hook ordering
 
 """
@@ -24,11 +24,21 @@ from shared.state import (
     ComponentInstance,
     use_state,
     render_component,
+    batch,
+    memo,
     _current_instance,
 )
 from shared.vdom import div, p, button
 
 
+@pytest.fixture(autouse=True)
+def _clear_current_instance():
+    """Reset the hook context that tests set directly on shared.state."""
+    import shared.state
+    yield
+    shared.state._current_instance = None
+
+
 class TestComponentInstance:
     """Test ComponentInstance class for managing component state."""
 
@@ -62,6 +72,13 @@ class TestComponentInstance:
         inst.hook_index += 1
         assert inst.hook_index == 2
 
+    def test_instance_has_no_dict(self):
+        """ComponentInstance uses slots and rejects unknown attributes."""
+        inst = ComponentInstance()
+        assert not hasattr(inst, "__dict__")
+        with pytest.raises(AttributeError):
+            inst.extra = 1
+
 
 class TestUseState:
     """Test use_state hook for component state management."""
@@ -194,6 +211,37 @@ class TestRenderComponent:
         # Should be cleared after render
         assert shared.state._current_instance is None
 
+    def test_render_component_restores_outer_instance(self):
+        """Nested render_component restores the enclosing instance."""
+        import shared.state
+        outer, inner = ComponentInstance(), ComponentInstance()
+
+        def Child(props):
+            use_state("child")
+            return p({}, "child")
+
+        def Parent(props):
+            render_component(Child, {}, inner)
+            assert shared.state._current_instance is outer
+            use_state("parent")
+            return div({}, "parent")
+
+        render_component(Parent, {}, outer)
+        assert outer.state == ["parent"]
+        assert inner.state == ["child"]
+        assert shared.state._current_instance is None
+
+    def test_render_component_clears_instance_on_error(self):
+        """render_component clears _current_instance if the component raises."""
+        import shared.state
+
+        def Broken(props):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            render_component(Broken, {}, ComponentInstance())
+        assert shared.state._current_instance is None
+
     def test_render_component_resets_hook_index(self):
         """render_component resets hook_index to 0 before render."""
         def TestComponent(props):
@@ -256,6 +304,171 @@ class TestRenderComponent:
         assert vnode.children[0].tag == "p"
 
 
+class TestBatch:
+    """Test batch() context manager for coalescing state updates."""
+
+    def test_batch_defers_schedule_update(self):
+        """Multiple set_value calls inside batch() trigger one update."""
+        import shared.state
+        inst = ComponentInstance()
+        shared.state._current_instance = inst
+
+        update_called = []
+        inst.schedule_update = lambda: update_called.append(True)
+
+        count, set_count = use_state(0)
+        name, set_name = use_state("")
+
+        with batch():
+            set_count(1)
+            set_name("Alice")
+            set_count(2)
+            # State is written immediately, render is deferred
+            assert inst.state == [2, "Alice"]
+            assert update_called == []
+
+        assert len(update_called) == 1
+
+    def test_nested_batch_flushes_on_outermost_exit(self):
+        """Nested batch() blocks flush only when the outermost exits."""
+        import shared.state
+        inst = ComponentInstance()
+        shared.state._current_instance = inst
+
+        update_called = []
+        inst.schedule_update = lambda: update_called.append(True)
+
+        count, set_count = use_state(0)
+
+        with batch():
+            with batch():
+                set_count(1)
+            assert update_called == []
+            set_count(2)
+
+        assert len(update_called) == 1
+
+    def test_batch_flushes_on_exception(self):
+        """Pending updates are flushed even if the block raises."""
+        import shared.state
+        inst = ComponentInstance()
+        shared.state._current_instance = inst
+
+        update_called = []
+        inst.schedule_update = lambda: update_called.append(True)
+
+        count, set_count = use_state(0)
+
+        with pytest.raises(ValueError):
+            with batch():
+                set_count(1)
+                raise ValueError("boom")
+
+        assert len(update_called) == 1
+
+        # Outside batch, updates are immediate again
+        set_count(2)
+        assert len(update_called) == 2
+
+
+class TestMemo:
+    """Test memo() caching of pure component output."""
+
+    def test_memo_reuses_output_for_equal_props(self):
+        """memo() skips the component body for props it has seen."""
+        calls = []
+
+        @memo
+        def Label(props):
+            calls.append(props["text"])
+            return p({}, props["text"])
+
+        first = Label({"text": "a"})
+        assert Label({"text": "a"}) is first
+        assert Label({"text": "b"}) is not first
+        assert calls == ["a", "b"]
+
+    def test_memo_rerenders_on_state_change(self):
+        """memo() keys on the current instance's state."""
+        @memo
+        def Counter(props):
+            count, set_count = use_state(0)
+            return p({}, f"Count: {count}")
+
+        inst = ComponentInstance()
+        vnode1 = render_component(Counter, {}, inst)
+        assert render_component(Counter, {}, inst) is vnode1
+
+        inst.state[0] = 1
+        vnode2 = render_component(Counter, {}, inst)
+        assert vnode2.children == ("Count: 1",)
+
+    def test_memo_renders_unhashable_props(self):
+        """memo() falls back to rendering when props are unhashable."""
+        @memo
+        def List(props):
+            return div({}, *props["items"])
+
+        assert List({"items": ["a"]}).children == ("a",)
+        assert List({"items": ["a", "b"]}).children == ("a", "b")
+
+    def test_memo_hit_keeps_sibling_and_parent_hooks_aligned(self):
+        """A cache hit advances hook_index past the memoized child's hooks."""
+        @memo
+        def Child(props):
+            label, _ = use_state("child")
+            return p({}, props["text"], label)
+
+        def Sibling(props):
+            value, _ = use_state("sibling")
+            return p({}, value)
+
+        def Parent(props):
+            count, _ = use_state(0)
+            child = Child({"text": "hi"})
+            sibling = Sibling({})
+            tail, _ = use_state("tail")
+            return div({}, f"Count: {count}", child, sibling, tail)
+
+        inst = ComponentInstance()
+        first = render_component(Parent, {}, inst)
+        assert inst.state == [0, "child", "sibling", "tail"]
+
+        # Parent state changes; the child hits its cache
+        inst.state[0] = 1
+        second = render_component(Parent, {}, inst)
+        assert second.children[1] is first.children[1]
+        assert second.children[0] == "Count: 1"
+        assert second.children[2].children == ("sibling",)
+        assert second.children[3] == "tail"
+        assert inst.state == [1, "child", "sibling", "tail"]
+
+    def test_memo_ignores_sibling_state(self):
+        """memo() keys on the child's own hook slots, not the whole instance."""
+        calls = []
+
+        @memo
+        def Child(props):
+            label, _ = use_state("x")
+            calls.append(label)
+            return p({}, label)
+
+        def Parent(props):
+            child = Child({})
+            other, _ = use_state(0)
+            return div({}, child, str(other))
+
+        inst = ComponentInstance()
+        render_component(Parent, {}, inst)
+        inst.state[1] = 5
+        render_component(Parent, {}, inst)
+        assert calls == ["x"]
+
+        inst.state[0] = "y"
+        assert render_component(Parent, {}, inst).children[0].children == ("y",)
+        assert calls == ["x", "y"]
+
+
 class TestIntegrationScenarios:
     """Integration tests for state management scenarios."""
 
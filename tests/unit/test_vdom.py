@@ -16,8 +16,10 @@ Tests cover:
 - Key assignment for list reconciliation
 """
 
+import sys
+
 import pytest
-from shared.vdom import VNode, h, div, button, span, h1, p, input_field
+from shared.vdom import VNode, h, subtree_equal, props_equal, memo_node, memo_node_by, div, button, span, h1, p, input_field
 
 
 class TestVNodeCreation:
@@ -28,7 +30,7 @@ class TestVNodeCreation:
         node = VNode(tag="div")
         assert node.tag == "div"
         assert node.props == {}
-        assert node.children == []
+        assert node.children == ()
         assert node.key is None
 
     def test_vnode_with_props(self):
@@ -53,10 +55,30 @@ class TestVNodeCreation:
         node = VNode(tag="li", key="item-1")
         assert node.key == "item-1"
 
+    def test_vnode_supports_positional_match(self):
+        """VNode destructures positionally in match statements."""
+        match div({"id": "x"}, "Hi"):
+            case VNode("div", props, ("Hi",)):
+                assert props == {"id": "x"}
+            case _:
+                pytest.fail("VNode did not match")
+
+    def test_vnode_uses_slots(self):
+        """VNode has no __dict__ but still accepts the client _el."""
+        node = VNode(tag="div")
+        assert not hasattr(node, "__dict__")
+        node._el = object()
+        assert node._el is not None
+
 
 class TestHFunction:
     """Test h() helper function for creating VNodes."""
 
+    def test_h_interns_tag(self):
+        """h() interns runtime-built tag names."""
+        tag = "".join(["d", "iv"])
+        assert h(tag).tag is sys.intern("div")
+
     def test_h_creates_vnode(self):
         """h() creates a VNode with correct tag."""
         node = h("div")
@@ -78,7 +100,7 @@ class TestHFunction:
         """h() handles multiple children via *args."""
         node = h("div", {}, "Hello", " ", "World")
         assert len(node.children) == 3
-        assert node.children == ["Hello", " ", "World"]
+        assert node.children == ("Hello", " ", "World")
 
     def test_h_with_nested_vnodes(self):
         """h() handles nested VNode children."""
@@ -203,6 +225,75 @@ class TestNestedStructures:
         assert all(isinstance(child, VNode) for child in container.children)
 
 
+class TestSubtreeEquality:
+    """Test VNode.static_hash and subtree_equal."""
+
+    def test_equal_trees_match(self):
+        """Structurally identical trees are subtree_equal."""
+        def build():
+            return div({"class": "card", "style": {"color": "red"}},
+                       span({}, "A"), "text")
+        assert subtree_equal(build(), build())
+
+    def test_changed_text_or_props_differ(self):
+        """Any change in props or descendants breaks equality."""
+        base = div({"class": "card"}, span({}, "A"))
+        assert not subtree_equal(base, div({"class": "card"}, span({}, "B")))
+        assert not subtree_equal(base, div({"class": "box"}, span({}, "A")))
+        assert not subtree_equal(base, div({"class": "card"}, p({}, "A")))
+
+    def test_handlers_compare_by_identity(self):
+        """Fresh handler closures make otherwise equal nodes differ."""
+        handler = lambda e: None
+        assert subtree_equal(button({"on_click": handler}), button({"on_click": handler}))
+        assert not subtree_equal(button({"on_click": lambda e: None}),
+                                 button({"on_click": lambda e: None}))
+
+    def test_props_equal_ignores_children(self):
+        """props_equal compares props only."""
+        a = div({"class": "card", "style": {"color": "red"}}, "A")
+        b = div({"class": "card", "style": {"color": "red"}}, "B")
+        assert props_equal(a, b)
+        assert not subtree_equal(a, b)
+        assert not props_equal(a, div({"class": "card"}, "A"))
+
+
+class TestMemoNode:
+    """Test memo_node and memo_node_by VNode factory caches."""
+
+    def test_memo_node_returns_cached_node(self):
+        """memo_node returns the same VNode for equal arguments."""
+        row = memo_node(lambda i: div({"key": f"item-{i}"}, f"Item {i}"))
+        assert row(1) is row(1)
+        assert row(2) is not row(1)
+        assert row(2).children == ("Item 2",)
+
+    def test_memo_node_by_uses_key_fn(self):
+        """memo_node_by caches by the key function, not the arguments."""
+        calls = []
+
+        @memo_node_by(lambda todo: todo["id"])
+        def row(todo):
+            calls.append(todo["id"])
+            return div({"key": todo["id"]}, todo["text"])
+
+        first = row({"id": 1, "text": "a"})
+        assert row({"id": 1, "text": "a"}) is first
+        row({"id": 2, "text": "b"})
+        assert calls == [1, 2]
+
+    def test_memo_node_by_evicts_least_recently_used(self, monkeypatch):
+        """memo_node_by keeps recently hit entries, like memo_node."""
+        monkeypatch.setattr("shared.vdom._MEMO_NODE_MAXSIZE", 2)
+        row = memo_node_by(lambda i: i)(lambda i: div({}, str(i)))
+
+        first = row(1)
+        row(2)
+        assert row(1) is first  # hit makes 1 the most recent
+        row(3)                  # evicts 2, not 1
+        assert row(1) is first
+
+
 class TestKeyBasedReconciliation:
     """Test key prop for list reconciliation."""
 
@@ -260,7 +351,22 @@ class TestEdgeCases:
     def test_empty_children_list(self):
         """VNode with empty children list."""
         node = h("div", {})
-        assert node.children == []
+        assert node.children == ()
+
+    def test_empty_props_are_shared_and_read_only(self):
+        """VNodes without props share one read-only empty mapping."""
+        a, b = h("div"), span()
+        assert a.props == {}
+        assert a.props is b.props is VNode(tag="p").props
+        with pytest.raises(TypeError):
+            a.props["class"] = "x"
+
+    def test_caller_props_dict_is_kept(self):
+        """An empty dict passed as props is stored as-is, still mutable."""
+        props = {}
+        node = span(props)
+        assert node.props is props
+        assert h("div", props).props is props
 
     def test_single_empty_string_child(self):
         """VNode with empty string child."""